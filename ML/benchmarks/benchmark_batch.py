@@ -0,0 +1,60 @@
+import os
+import json
+import time
+import random
+
+import torch
+
+from common import ml_path, load_model, print_table, model_path_from_argv
+from core.inference import predict, predict_batch
+from utils import find_latest_version_path
+
+
+BATCH_SIZES = [1, 8, 32, 128]
+CORPUS_SIZE = 10000
+
+
+def load_corpus(size=CORPUS_SIZE, seed=42):
+    base = os.path.join(ml_path, "datasets", "05_final_merged", "aviation_cmds_final_training_set.jsonl")
+    dataset_path = find_latest_version_path(base)
+    with open(dataset_path, "r") as f:
+        texts = [json.loads(line)['text'] for line in f]
+    random.Random(seed).shuffle(texts)
+    return texts[:size], dataset_path
+
+
+def run_benchmark(model_path=None):
+    loader, results = load_model(model_path)
+    texts, dataset_path = load_corpus()
+    print(f"Model: {results['model']['model_path']}")
+    print(f"Corpus: {len(texts)} utterances from {os.path.basename(dataset_path)}, threads: {torch.get_num_threads()}\n")
+
+    args = (loader.model, loader.tokenizer, loader.device, loader.intent_map_rev, loader.slot_map_rev)
+
+    start = time.perf_counter()
+    reference = [predict(text, *args) for text in texts]
+    loop_s = time.perf_counter() - start
+    rows = [["predict loop", f"{loop_s:.2f}", f"{len(texts) / loop_s:.0f}", "1.00x", 0]]
+
+    for batch_size in BATCH_SIZES:
+        start = time.perf_counter()
+        batched = predict_batch(texts, *args, batch_size=batch_size)
+        elapsed = time.perf_counter() - start
+
+        mismatches = sum(
+            1 for ref, out in zip(reference, batched)
+            if ref['intent'] != out['intent'] or ref['slots'] != out['slots']
+        )
+        rows.append([
+            f"predict_batch bs={batch_size}",
+            f"{elapsed:.2f}",
+            f"{len(texts) / elapsed:.0f}",
+            f"{loop_s / elapsed:.2f}x",
+            mismatches
+        ])
+
+    print_table(["mode", "total s", "utt/s", "speedup", "mismatches"], rows)
+
+
+if __name__ == "__main__":
+    run_benchmark(model_path_from_argv())
@@ -0,0 +1,92 @@
+import os
+import sys
+import json
+import time
+import resource
+import subprocess
+
+import torch
+
+from common import print_table, model_path_from_argv
+from core.model_loader import ModelLoader
+from core.bundle import BUNDLE_FILENAME, bundle_is_fresh
+from utils import get_latest_model_path
+
+
+def directory_load(model_path):
+    loader = ModelLoader(torch.device("cpu"), use_torchscript=False, use_bundle=False)
+    loader.load_all(model_path)
+    return loader
+
+
+def bundle_load(model_path):
+    loader = ModelLoader(torch.device("cpu"))
+    loader.load_all(os.path.join(model_path, BUNDLE_FILENAME))
+    return loader
+
+
+MODES = {'vN directory': directory_load, 'mapped bundle': bundle_load}
+
+
+def measure(mode, model_path):
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    start = time.perf_counter()
+    loader = MODES[mode](model_path)
+    load_s = time.perf_counter() - start
+    loader.session.predict("set com 1 to 121.5")
+    return {
+        'load_s': load_s,
+        'first_command_s': time.perf_counter() - start,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'rss_before_mb': rss_before
+    }
+
+
+def check_parity(model_path):
+    from common import BENCHMARK_TEXTS
+    directory, bundle = directory_load(model_path), bundle_load(model_path)
+    agree = 0
+    for text in BENCHMARK_TEXTS:
+        a, b = directory.session.predict(text), bundle.session.predict(text)
+        agree += a['intent'] == b['intent'] and a['slots'] == b['slots']
+    return agree, len(BENCHMARK_TEXTS)
+
+
+def run_benchmark(model_path=None, runs=3):
+    model_path = model_path or get_latest_model_path()
+    if not bundle_is_fresh(model_path):
+        print(f"No up-to-date {BUNDLE_FILENAME} in {model_path}, run export_bundle.py first.")
+        return
+    print(f"Model: {model_path}, {runs} fresh processes per mode\n")
+
+    rows = []
+    for mode in MODES:
+        samples = []
+        for _ in range(runs):
+            completed = subprocess.run(
+                [sys.executable, __file__, "--measure", mode, model_path], capture_output=True, text=True
+            )
+            if completed.returncode != 0:
+                print(f"{mode} failed: {completed.stderr.strip().splitlines()[-1]}")
+                break
+            samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+        if not samples:
+            continue
+        rows.append([
+            mode,
+            f"{min(s['load_s'] for s in samples):.3f}",
+            f"{sorted(s['load_s'] for s in samples)[len(samples) // 2]:.3f}",
+            f"{sorted(s['first_command_s'] for s in samples)[len(samples) // 2]:.3f}",
+            f"{min(s['peak_rss_mb'] - s['rss_before_mb'] for s in samples):.0f}"
+        ])
+
+    print_table(["mode", "best load s", "median load s", "median to first command s", "RSS growth MB"], rows)
+    agree, total = check_parity(model_path)
+    print(f"\nDirectory and bundle agree on {agree}/{total} benchmark commands")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 3 and sys.argv[1] == "--measure":
+        print(json.dumps(measure(sys.argv[2], sys.argv[3])))
+    else:
+        run_benchmark(model_path_from_argv())
@@ -0,0 +1,81 @@
+import os
+import sys
+import json
+import time
+import resource
+import subprocess
+
+import torch
+from transformers import DistilBertForTokenClassification
+
+from common import print_table, model_path_from_argv
+from core import JointIntentAndSlotModel
+from core.model_loader import ModelLoader
+from utils import get_latest_model_path
+
+
+def legacy_load(model_path):
+    # What ModelLoader did before: build on the base checkpoint, then replace it
+    loader = ModelLoader(torch.device("cpu"), use_torchscript=False)
+    dims = loader.load_maps(model_path)
+    model = JointIntentAndSlotModel(num_intents=dims['intents'], num_slots=dims['slots'])
+    model.bert_for_slots = DistilBertForTokenClassification.from_pretrained(model_path)
+    model.intent_classifier.load_state_dict(torch.load(os.path.join(model_path, "intent_classifier.bin")))
+    return model.eval()
+
+
+def config_load(model_path):
+    loader = ModelLoader(torch.device("cpu"), use_torchscript=False)
+    loader.load_model(model_path)
+    return loader.model
+
+
+MODES = {'base + fine-tuned (old)': legacy_load, 'config only': config_load}
+
+
+def measure(mode, model_path):
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    start = time.perf_counter()
+    MODES[mode](model_path)
+    return {
+        'load_s': time.perf_counter() - start,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'rss_before_mb': rss_before
+    }
+
+
+def run_benchmark(model_path=None, runs=3):
+    model_path = model_path or get_latest_model_path()
+    print(f"Model: {model_path}, {runs} fresh processes per mode\n")
+
+    rows = []
+    for mode in MODES:
+        samples = []
+        for _ in range(runs):
+            completed = subprocess.run(
+                [sys.executable, __file__, "--measure", mode, model_path], capture_output=True, text=True
+            )
+            if completed.returncode != 0:
+                # The old path needs distilbert-base-uncased from the hub or the local HF cache
+                samples = None
+                print(f"{mode} failed: {completed.stderr.strip().splitlines()[-1]}")
+                break
+            samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+        if not samples:
+            continue
+        rows.append([
+            mode,
+            f"{min(s['load_s'] for s in samples):.2f}",
+            f"{sorted(s['load_s'] for s in samples)[len(samples) // 2]:.2f}",
+            f"{min(s['peak_rss_mb'] for s in samples):.0f}",
+            f"{min(s['peak_rss_mb'] - s['rss_before_mb'] for s in samples):.0f}"
+        ])
+
+    print_table(["mode", "best load s", "median load s", "peak RSS MB", "RSS growth MB"], rows)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 3 and sys.argv[1] == "--measure":
+        print(json.dumps(measure(sys.argv[2], sys.argv[3])))
+    else:
+        run_benchmark(model_path_from_argv())
@@ -0,0 +1,100 @@
+import os
+import sys
+import argparse
+import subprocess
+
+from common import print_table
+
+
+ML_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+REPO_DIR = os.path.dirname(ML_DIR)
+
+# X-Plane provides XPPython3 inside the sim; outside it an empty placeholder
+# module lets the plugin file be imported and timed
+PLUGIN_IMPORT = (
+    "import sys, types\n"
+    "try:\n"
+    "    import XPPython3\n"
+    "except ImportError:\n"
+    "    sys.modules['XPPython3'] = types.ModuleType('XPPython3')\n"
+    "    sys.modules['XPPython3'].xp = None\n"
+    "import xplane_vimaan_copilot\n"
+)
+
+# name: (code, working directory, budget in ms, modules that must not be imported)
+TARGETS = {
+    'plugin module': (PLUGIN_IMPORT, REPO_DIR, 800, ('torch', 'transformers', 'onnxruntime')),
+    'core (text only)': ("import core", ML_DIR, 150, ('torch', 'transformers', 'numpy')),
+    'runtime': ("import runtime", ML_DIR, 600, ('torch', 'transformers')),
+    'predict.py': ("import predict", ML_DIR, 4000, ('transformers.models',)),
+    'command_tester.py': ("import command_tester", ML_DIR, 4000, ('transformers.models',)),
+}
+
+
+def parse_importtime(stderr):
+    """Returns [(module, self_us, cumulative_us, depth)] from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def measure(code, cwd):
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=cwd, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    return parse_importtime(completed.stderr)
+
+
+def run_benchmark(runs=3, scale=1.0, top=5):
+    rows, failures, heaviest = [], [], {}
+    for target, (code, cwd, budget_ms, forbidden) in TARGETS.items():
+        budget_ms *= scale
+        try:
+            samples = [measure(code, cwd) for _ in range(runs)]
+        except RuntimeError as e:
+            rows.append([target, "-", f"{budget_ms:.0f}", "error", str(e)])
+            failures.append(target)
+            continue
+
+        # Top-level entries (depth 0) add up to the whole import
+        totals = sorted(sum(c for _, _, c, depth in sample if depth == 0) / 1000 for sample in samples)
+        total_ms = totals[len(totals) // 2]
+        modules = {name for name, _, _, _ in samples[0]}
+        leaked = sorted(f for f in forbidden if any(m == f or m.startswith(f + ".") for m in modules))
+        ok = total_ms <= budget_ms and not leaked
+        if not ok:
+            failures.append(target)
+
+        rows.append([target, f"{total_ms:.0f}", f"{budget_ms:.0f}", "ok" if ok else "OVER", ", ".join(leaked) or "-"])
+        # Direct imports of the target module, i.e. what to defer next
+        heaviest[target] = sorted(
+            ((name, c) for name, _, c, depth in samples[0] if depth == 1), key=lambda item: item[1], reverse=True
+        )[:top]
+
+    print_table(["target", "median ms", "budget ms", "status", "heavy modules imported"], rows)
+    print("\nHeaviest direct imports:")
+    for target, modules in heaviest.items():
+        print(f"{target}: " + ", ".join(f"{name} {c / 1000:.0f} ms" for name, c in modules))
+    return failures
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Import-time budget for the plugin and the ML CLIs")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, e.g. 2 on a slow machine")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    failures = run_benchmark(args.runs, args.scale)
+    if failures:
+        print(f"\nOver budget: {', '.join(failures)}")
+        sys.exit(1)
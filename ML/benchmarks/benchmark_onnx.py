@@ -0,0 +1,94 @@
+import sys
+import json
+import time
+import resource
+import subprocess
+
+from common import BENCHMARK_TEXTS, load_model, time_calls, latency_stats, print_table
+from core.inference import predict, predict_batch
+from benchmark_batch import load_corpus
+
+
+PARITY_CORPUS_SIZE = 2000
+
+
+def measure_backend(backend, model_path):
+    # Run in a fresh process so cold start and peak RSS are not shared between backends
+    start = time.perf_counter()
+    loader, results = load_model(model_path, backend=backend)
+    cold_start_s = time.perf_counter() - start
+
+    fn = lambda text: predict(
+        text, loader.model, loader.tokenizer, loader.device, loader.intent_map_rev, loader.slot_map_rev
+    )
+    first_start = time.perf_counter()
+    fn(BENCHMARK_TEXTS[0])
+    first_ms = (time.perf_counter() - first_start) * 1000
+
+    latencies, _ = time_calls(fn, BENCHMARK_TEXTS, repeats=20)
+    stats = latency_stats(latencies)
+    return {
+        'backend': backend,
+        'cold_start_s': cold_start_s,
+        'first_predict_ms': first_ms,
+        'mean_ms': stats['mean'],
+        'p50_ms': stats['p50'],
+        'p95_ms': stats['p95'],
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }
+
+
+def check_parity(model_path):
+    torch_loader, results = load_model(model_path, backend='torch')
+    onnx_loader, _ = load_model(results['model']['model_path'], backend='onnx')
+    texts = BENCHMARK_TEXTS + load_corpus(PARITY_CORPUS_SIZE)[0]
+
+    def run(loader):
+        return predict_batch(
+            texts, loader.model, loader.tokenizer, loader.device, loader.intent_map_rev, loader.slot_map_rev
+        )
+
+    torch_results = run(torch_loader)
+    onnx_results = run(onnx_loader)
+
+    intent_agree = sum(t['intent'] == o['intent'] for t, o in zip(torch_results, onnx_results))
+    slot_agree = sum(t['slots'] == o['slots'] for t, o in zip(torch_results, onnx_results))
+    max_conf_diff = max(abs(t['confidence'] - o['confidence']) for t, o in zip(torch_results, onnx_results))
+
+    print(f"Parity over {len(texts)} utterances (command_tester cases + dataset sample):")
+    print(f"  intent agreement: {intent_agree}/{len(texts)}")
+    print(f"  slot agreement:   {slot_agree}/{len(texts)}")
+    print(f"  max confidence difference: {max_conf_diff:.2e}\n")
+    return results['model']['model_path'], intent_agree == len(texts) and slot_agree == len(texts)
+
+
+def run_benchmark(model_path=None):
+    model_path, parity_ok = check_parity(model_path)
+
+    rows = []
+    for backend in ('torch', 'onnx'):
+        output = subprocess.run(
+            [sys.executable, __file__, "--measure", backend, model_path],
+            check=True, capture_output=True, text=True
+        ).stdout
+        stats = json.loads(output.strip().splitlines()[-1])
+        rows.append([
+            backend,
+            f"{stats['cold_start_s']:.2f}",
+            f"{stats['first_predict_ms']:.1f}",
+            f"{stats['mean_ms']:.2f}",
+            f"{stats['p50_ms']:.2f}",
+            f"{stats['p95_ms']:.2f}",
+            f"{stats['peak_rss_mb']:.0f}"
+        ])
+
+    print_table(["backend", "cold start s", "first ms", "mean ms", "p50 ms", "p95 ms", "peak RSS MB"], rows)
+    return parity_ok
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--measure":
+        print(json.dumps(measure_backend(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)))
+    else:
+        parity_ok = run_benchmark(sys.argv[1] if len(sys.argv) > 1 else None)
+        sys.exit(0 if parity_ok else 1)
@@ -0,0 +1,90 @@
+import sys
+import json
+import time
+import argparse
+import subprocess
+import multiprocessing
+
+from common import BENCHMARK_TEXTS, load_model, time_calls, latency_stats, print_table
+from core.inference import predict
+
+
+TUNED_THREADS = min(2, multiprocessing.cpu_count())
+
+MODES = {
+    # name: (use InferenceSession, intra-op threads, inter-op threads)
+    'predict, default threads': (False, None, None),
+    'session, default threads': (True, None, None),
+    'session, tuned threads': (True, TUNED_THREADS, 1),
+}
+
+
+def burn_cpu(stop_at):
+    # Stand-in for X-Plane keeping cores busy while a command is interpreted
+    while time.time() < stop_at:
+        sum(i * i for i in range(10000))
+
+
+def measure_mode(mode, model_path, repeats):
+    use_session, intra, inter = MODES[mode]
+    loader, results = load_model(model_path, intra_op_threads=intra, inter_op_threads=inter)
+
+    if use_session:
+        fn = lambda text: loader.session.predict(text)
+    else:
+        fn = lambda text: predict(
+            text, loader.model, loader.tokenizer, loader.device, loader.intent_map_rev, loader.slot_map_rev
+        )
+
+    latencies, _ = time_calls(fn, BENCHMARK_TEXTS, repeats=repeats, warmup=len(BENCHMARK_TEXTS))
+    return {'mode': mode, 'threads': results['threads'], 'max': max(latencies), **latency_stats(latencies)}
+
+
+def run_benchmark(model_path, repeats, busy):
+    burners = []
+    if busy:
+        stop_at = time.time() + 3600
+        burners = [multiprocessing.Process(target=burn_cpu, args=(stop_at,), daemon=True) for _ in range(busy)]
+        for burner in burners:
+            burner.start()
+
+    rows = []
+    try:
+        for mode in MODES:
+            # Thread pools are process-wide, so each mode runs in its own process
+            command = [sys.executable, __file__, "--measure", mode, "--repeats", str(repeats)]
+            if model_path:
+                command += ["--model", model_path]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            stats = json.loads(output.strip().splitlines()[-1])
+            rows.append([
+                mode,
+                f"{stats['threads']['intra_op_threads']}/{stats['threads']['inter_op_threads']}",
+                f"{stats['mean']:.2f}",
+                f"{stats['stdev']:.2f}",
+                f"{stats['p50']:.2f}",
+                f"{stats['p95']:.2f}",
+                f"{stats['p99']:.2f}",
+                f"{stats['max']:.2f}"
+            ])
+    finally:
+        for burner in burners:
+            burner.terminate()
+
+    print(f"CPUs: {multiprocessing.cpu_count()}, busy background processes: {busy}, "
+          f"{repeats} x {len(BENCHMARK_TEXTS)} commands per mode\n")
+    print_table(["mode", "intra/inter", "mean ms", "stdev ms", "p50 ms", "p95 ms", "p99 ms", "max ms"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Latency and variance of predict vs InferenceSession")
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--busy", type=int, default=0, help="CPU-burning background processes")
+    parser.add_argument("--measure", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure_mode(args.measure, args.model, args.repeats)))
+    else:
+        run_benchmark(args.model, args.repeats, args.busy)
@@ -0,0 +1,80 @@
+import time
+
+import torch
+
+from common import load_model, print_table, model_path_from_argv
+from core import normalize_aviation_input
+from core.inference import extract_slots_batch, MAX_SEQ_LENGTH
+from core.slot_decoding import decode_slots_batch, build_tag_tables
+from benchmark_batch import load_corpus
+
+
+BATCH_SIZE = 128
+REPEATS = 5
+
+
+def encode_batches(loader, texts):
+    # Run the model once up front so only the decoding step is timed
+    batches = []
+    for start in range(0, len(texts), BATCH_SIZE):
+        normalized = [normalize_aviation_input(text) for text in texts[start:start + BATCH_SIZE]]
+        encoding = loader.tokenizer(
+            normalized, padding='longest', truncation=True, max_length=MAX_SEQ_LENGTH,
+            return_offsets_mapping=True, return_tensors='pt'
+        )
+        with torch.no_grad():
+            _, _, slot_logits = loader.model(encoding['input_ids'], encoding['attention_mask'])
+        batches.append({
+            'normalized': normalized,
+            'tags': torch.argmax(slot_logits, dim=2).numpy(),
+            'input_ids': encoding['input_ids'].numpy(),
+            'attention_mask': encoding['attention_mask'].numpy(),
+            'offset_mapping': encoding['offset_mapping'].numpy()
+        })
+    return batches
+
+
+def run_benchmark(model_path=None):
+    loader, results = load_model(model_path)
+    texts, _ = load_corpus()
+    batches = encode_batches(loader, texts)
+    tables = build_tag_tables(loader.slot_map_rev)
+    print(f"Model: {results['model']['model_path']}")
+    print(f"Corpus: {len(texts)} utterances in batches of {BATCH_SIZE}\n")
+
+    def token_strings():
+        return [
+            slots for batch in batches
+            for slots in extract_slots_batch(
+                batch['tags'], batch['input_ids'], batch['attention_mask'], loader.tokenizer, loader.slot_map_rev
+            )
+        ]
+
+    def offsets():
+        return [
+            slots for batch in batches
+            for slots in decode_slots_batch(
+                batch['tags'], batch['offset_mapping'], batch['normalized'], loader.slot_map_rev, tables
+            )
+        ]
+
+    rows = []
+    outputs = {}
+    for name, fn in (("token strings", token_strings), ("offset mapping", offsets)):
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            outputs[name] = fn()
+        elapsed = (time.perf_counter() - start) / REPEATS
+        rows.append([name, f"{elapsed * 1000:.1f}", f"{elapsed * 1e6 / len(texts):.1f}"])
+    print_table(["decoder", "ms per corpus", "us per utterance"], rows)
+
+    reference, candidate = outputs["token strings"], outputs["offset mapping"]
+    differing = [i for i, (a, b) in enumerate(zip(reference, candidate)) if a != b]
+    print(f"\nDiffering slot dicts: {len(differing)}/{len(texts)}")
+    normalized = [text for batch in batches for text in batch['normalized']]
+    for i in differing[:10]:
+        print(f"  {normalized[i]!r}: {reference[i]} -> {candidate[i]}")
+
+
+if __name__ == "__main__":
+    run_benchmark(model_path_from_argv())
@@ -0,0 +1,46 @@
+import sys
+
+import torch
+
+from common import load_model, print_table
+from core.quantization import QUANTIZED_FILENAME, SOURCE_WEIGHT_FILES
+from quantization_report import load_validation_split, evaluate, artifact_size_mb
+from utils import get_latest_model_path
+
+
+def run_benchmark(teacher_path, student_path):
+    val_data, _ = load_validation_split()
+    print(f"Validation: {len(val_data)} utterances, threads: {torch.get_num_threads()}\n")
+
+    rows = []
+    for name, model_path in (("teacher", teacher_path), ("student", student_path)):
+        for quantize in (False, True):
+            loader, results = load_model(model_path, quantize=quantize, use_torchscript=False)
+            report = evaluate(loader, val_data)
+            config = loader.model.bert_for_slots.config
+            filenames = (QUANTIZED_FILENAME,) if quantize else SOURCE_WEIGHT_FILES
+            rows.append([
+                f"{name}{' int8' if quantize else ''}",
+                f"{config.n_layers}x{config.dim}",
+                f"{artifact_size_mb(model_path, filenames):.1f}",
+                f"{results['load_s']:.2f}",
+                f"{report['tester_acc']:.1%}",
+                f"{report['val_intent_acc']:.2%}",
+                f"{report['val_slot_acc']:.2%}",
+                f"{report['latency']['p50']:.2f}",
+                f"{report['latency']['p95']:.2f}"
+            ])
+            del loader
+
+    print_table(
+        ["model", "layers x dim", "size MB", "load s", "tester", "val intent", "val slots", "p50 ms", "p95 ms"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_student.py [teacher_path] student_path")
+        sys.exit(1)
+    teacher = sys.argv[1] if len(sys.argv) > 2 else get_latest_model_path()
+    run_benchmark(teacher, sys.argv[-1])
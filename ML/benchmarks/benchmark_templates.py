@@ -0,0 +1,77 @@
+import os
+import json
+import time
+import random
+
+from common import ml_path, BENCHMARK_TEXTS, load_model, print_table, model_path_from_argv
+from core import normalize_aviation_input
+from core.inference import predict_batch
+from core.template_matcher import TemplateMatcher
+from utils import find_latest_version_path
+
+
+CORPUS_SIZE = 10000
+
+
+def load_labelled_corpus(size=CORPUS_SIZE, seed=42):
+    base = os.path.join(ml_path, "datasets", "05_final_merged", "aviation_cmds_final_training_set.jsonl")
+    dataset_path = find_latest_version_path(base)
+    with open(dataset_path, "r") as f:
+        records = [json.loads(line) for line in f]
+    random.Random(seed).shuffle(records)
+    return records[:size], dataset_path
+
+
+def run_benchmark(model_path=None):
+    loader, results = load_model(model_path)
+    records, dataset_path = load_labelled_corpus()
+    texts = [record['text'] for record in records]
+
+    start = time.perf_counter()
+    matcher = TemplateMatcher()
+    compile_ms = (time.perf_counter() - start) * 1000
+    print(f"Model: {results['model']['model_path']}")
+    print(f"Corpus: {len(texts)} utterances from {os.path.basename(dataset_path)}")
+    print(f"Compiled {matcher.templates} templates in {compile_ms:.1f} ms, skipped {len(matcher.skipped)}\n")
+
+    normalized = [normalize_aviation_input(text) for text in texts]
+    start = time.perf_counter()
+    matched = [matcher.match(text, norm) for text, norm in zip(texts, normalized)]
+    template_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model = predict_batch(
+        texts, loader.model, loader.tokenizer, loader.device, loader.intent_map_rev, loader.slot_map_rev,
+        batch_size=1
+    )
+    model_s = time.perf_counter() - start
+
+    hits = [i for i, result in enumerate(matched) if result is not None]
+    stats = matcher.stats()
+    intent_agree = sum(matched[i]['intent'] == model[i]['intent'] for i in hits)
+    full_agree = sum(matched[i]['intent'] == model[i]['intent'] and matched[i]['slots'] == model[i]['slots'] for i in hits)
+    template_gold = sum(matched[i]['intent'] == records[i]['intent'] for i in hits)
+    model_gold = sum(model[i]['intent'] == records[i]['intent'] for i in hits)
+
+    print_table(["outcome", "count", "share"], [
+        [name, stats[name], f"{stats[name] / len(texts):.1%}"] for name in ('hits', 'ambiguous', 'misses')
+    ])
+    if hits:
+        print(f"\nOn template hits ({len(hits)}):")
+        print(f"  agreement with model, intent:         {intent_agree / len(hits):.2%}")
+        print(f"  agreement with model, intent + slots: {full_agree / len(hits):.2%}")
+        print(f"  gold intent accuracy, template/model: {template_gold / len(hits):.2%} / {model_gold / len(hits):.2%}")
+    print(f"\nPer utterance: template {template_s * 1e6 / len(texts):.1f} us (all), "
+          f"model {model_s * 1000 / len(texts):.2f} ms")
+
+    tester_hits = sum(1 for text in BENCHMARK_TEXTS if matcher.match(text) is not None)
+    print(f"command_tester cases resolved by templates: {tester_hits}/{len(BENCHMARK_TEXTS)}")
+
+    disagreements = [i for i in hits if matched[i]['intent'] != model[i]['intent'] or matched[i]['slots'] != model[i]['slots']]
+    for i in disagreements[:10]:
+        print(f"  {texts[i]!r}: template {matched[i]['intent']} {matched[i]['slots']} | "
+              f"model {model[i]['intent']} {model[i]['slots']} | gold {records[i]['intent']} {records[i]['slots']}")
+
+
+if __name__ == "__main__":
+    run_benchmark(model_path_from_argv())
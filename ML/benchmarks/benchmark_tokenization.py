@@ -0,0 +1,53 @@
+import torch
+
+from common import BENCHMARK_TEXTS, load_model, time_calls, latency_stats, print_table, model_path_from_argv
+from core.inference import predict
+
+
+PADDING_MODES = [
+    ("max_length (64)", {'padding': 'max_length'}),
+    ("dynamic", {'padding': 'longest'}),
+    ("bucket x8", {'padding': 'longest', 'pad_to_multiple_of': 8}),
+]
+
+
+def run_benchmark(model_path=None, repeats=20):
+    torch.set_num_threads(1)
+    loader, results = load_model(model_path)
+    print(f"Model: {results['model']['model_path']}")
+    print(f"Commands: {len(BENCHMARK_TEXTS)}, repeats: {repeats}, threads: 1\n")
+
+    def make_fn(options):
+        return lambda text: predict(
+            text, loader.model, loader.tokenizer, loader.device,
+            loader.intent_map_rev, loader.slot_map_rev, **options
+        )
+
+    rows = []
+    baseline = None
+    reference_outputs = None
+    for name, options in PADDING_MODES:
+        latencies, outputs = time_calls(make_fn(options), BENCHMARK_TEXTS, repeats=repeats)
+        stats = latency_stats(latencies)
+        if baseline is None:
+            baseline = stats['mean']
+            reference_outputs = outputs
+
+        mismatches = sum(
+            1 for ref, out in zip(reference_outputs, outputs)
+            if ref['intent'] != out['intent'] or ref['slots'] != out['slots']
+        )
+        rows.append([
+            name,
+            f"{stats['mean']:.2f}",
+            f"{stats['p50']:.2f}",
+            f"{stats['p95']:.2f}",
+            f"{baseline / stats['mean']:.2f}x",
+            mismatches
+        ])
+
+    print_table(["padding", "mean ms", "p50 ms", "p95 ms", "speedup", "mismatches"], rows)
+
+
+if __name__ == "__main__":
+    run_benchmark(model_path_from_argv())
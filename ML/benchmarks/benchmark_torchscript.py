@@ -0,0 +1,102 @@
+import sys
+import json
+import time
+import subprocess
+
+import torch
+
+from common import BENCHMARK_TEXTS, load_model, time_calls, latency_stats, print_table
+from core.inference import predict, predict_batch
+from benchmark_batch import load_corpus
+
+
+PARITY_CORPUS_SIZE = 2000
+
+
+def measure_format(use_torchscript, model_path):
+    # Fresh process per format so the traced run does not benefit from the eager one's warm caches
+    start = time.perf_counter()
+    loader, results = load_model(model_path, use_torchscript=use_torchscript)
+    cold_start_s = time.perf_counter() - start
+
+    fn = lambda text: predict(
+        text, loader.model, loader.tokenizer, loader.device, loader.intent_map_rev, loader.slot_map_rev
+    )
+    first_start = time.perf_counter()
+    fn(BENCHMARK_TEXTS[0])
+    first_ms = (time.perf_counter() - first_start) * 1000
+
+    latencies, _ = time_calls(fn, BENCHMARK_TEXTS, repeats=20)
+    stats = latency_stats(latencies)
+    return {
+        'format': results['model']['format'],
+        'cold_start_s': cold_start_s,
+        'first_predict_ms': first_ms,
+        'mean_ms': stats['mean'],
+        'p50_ms': stats['p50'],
+        'p95_ms': stats['p95']
+    }
+
+
+def check_parity(model_path):
+    eager_loader, results = load_model(model_path, use_torchscript=False)
+    model_path = results['model']['model_path']
+    traced_loader, traced_results = load_model(model_path)
+    if traced_results['model']['format'] != 'torchscript':
+        raise SystemExit(f"No usable TorchScript artifact in {model_path}, run export_torchscript.py first "
+                         f"({traced_results['model']['torchscript_error'] or 'missing or stale'})")
+
+    texts = BENCHMARK_TEXTS + load_corpus(PARITY_CORPUS_SIZE)[0]
+
+    def run(loader):
+        return predict_batch(
+            texts, loader.model, loader.tokenizer, loader.device, loader.intent_map_rev, loader.slot_map_rev
+        )
+
+    eager_results = run(eager_loader)
+    traced_results = run(traced_loader)
+
+    intent_agree = sum(e['intent'] == t['intent'] for e, t in zip(eager_results, traced_results))
+    slot_agree = sum(e['slots'] == t['slots'] for e, t in zip(eager_results, traced_results))
+
+    print(f"Parity over {len(texts)} utterances (command_tester cases + dataset sample):")
+    print(f"  intent agreement: {intent_agree}/{len(texts)}")
+    print(f"  slot agreement:   {slot_agree}/{len(texts)}\n")
+    return model_path, intent_agree == len(texts) and slot_agree == len(texts)
+
+
+def run_benchmark(model_path=None):
+    model_path, parity_ok = check_parity(model_path)
+
+    measured = []
+    for use_torchscript in (False, True):
+        output = subprocess.run(
+            [sys.executable, __file__, "--measure", "1" if use_torchscript else "0", model_path],
+            check=True, capture_output=True, text=True
+        ).stdout
+        measured.append(json.loads(output.strip().splitlines()[-1]))
+
+    eager = measured[0]
+    rows = []
+    for stats in measured:
+        rows.append([
+            stats['format'],
+            f"{stats['cold_start_s']:.2f}",
+            f"{stats['first_predict_ms']:.1f}",
+            f"{stats['mean_ms']:.2f}",
+            f"{stats['p50_ms']:.2f}",
+            f"{stats['p95_ms']:.2f}",
+            f"{eager['p50_ms'] / stats['p50_ms']:.2f}x"
+        ])
+
+    print(f"Threads: {torch.get_num_threads()}")
+    print_table(["format", "cold start s", "first ms", "mean ms", "p50 ms", "p95 ms", "p50 speedup"], rows)
+    return parity_ok
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--measure":
+        print(json.dumps(measure_format(sys.argv[2] == "1", sys.argv[3] if len(sys.argv) > 3 else None)))
+    else:
+        parity_ok = run_benchmark(sys.argv[1] if len(sys.argv) > 1 else None)
+        sys.exit(0 if parity_ok else 1)
@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import statistics
+
+import torch
+
+ml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ml_path)
+
+from core.model_loader import ModelLoader
+from command_tester import TEST_COMMANDS
+
+
+BENCHMARK_TEXTS = [text for text, _ in TEST_COMMANDS]
+
+
+def load_model(model_path=None, device=None, **loader_kwargs):
+    device = device or torch.device("cpu")
+    loader = ModelLoader(device, **loader_kwargs)
+    start = time.perf_counter()
+    results = loader.load_all(model_path)
+    results['load_s'] = time.perf_counter() - start
+    return loader, results
+
+
+def time_calls(fn, items, repeats=20, warmup=3):
+    for item in items[:warmup]:
+        fn(item)
+
+    latencies = []
+    outputs = []
+    for _ in range(repeats):
+        for item in items:
+            start = time.perf_counter()
+            output = fn(item)
+            latencies.append((time.perf_counter() - start) * 1000)
+            outputs.append(output)
+    return latencies, outputs
+
+
+def latency_stats(latencies):
+    ordered = sorted(latencies)
+    return {
+        'n': len(ordered),
+        'mean': statistics.fmean(ordered),
+        'stdev': statistics.pstdev(ordered),
+        'p50': ordered[len(ordered) // 2],
+        'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        'p99': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    }
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(row[i])) for row in rows)) for i, h in enumerate(headers)]
+    print(" | ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("-+-".join("-" * w for w in widths))
+    for row in rows:
+        print(" | ".join(str(c).ljust(w) for c, w in zip(row, widths)))
+
+
+def model_path_from_argv():
+    return sys.argv[1] if len(sys.argv) > 1 else None
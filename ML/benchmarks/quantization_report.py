@@ -0,0 +1,111 @@
+import os
+import json
+
+import torch
+from sklearn.model_selection import train_test_split
+
+from common import ml_path, BENCHMARK_TEXTS, load_model, time_calls, latency_stats, print_table, model_path_from_argv
+from command_tester import TEST_COMMANDS
+from core import normalize_dataset
+from core.inference import predict, predict_batch
+from core.quantization import QUANTIZED_FILENAME, SOURCE_WEIGHT_FILES
+from utils import find_latest_version_path
+
+
+def load_validation_split():
+    # Same split as train_nlu_model.py so the numbers line up with training-time validation
+    base = os.path.join(ml_path, "datasets", "05_final_merged", "aviation_cmds_final_training_set.jsonl")
+    dataset_path = find_latest_version_path(base)
+    with open(dataset_path, "r") as f:
+        data = [json.loads(line) for line in f]
+    data = normalize_dataset(data)
+    _, val_data = train_test_split(data, test_size=0.15, random_state=42)
+    return val_data, dataset_path
+
+
+def artifact_size_mb(model_path, filenames):
+    paths = [os.path.join(model_path, name) for name in filenames]
+    return sum(os.path.getsize(p) for p in paths if os.path.exists(p)) / (1024 * 1024)
+
+
+def slots_match(predicted, expected):
+    return {k: str(v) for k, v in predicted.items()} == {k: str(v) for k, v in expected.items()}
+
+
+def evaluate(loader, val_data):
+    args = (loader.model, loader.tokenizer, loader.device, loader.intent_map_rev, loader.slot_map_rev)
+
+    tester = predict_batch([text for text, _ in TEST_COMMANDS], *args)
+    tester_correct = sum(1 for (_, expected), out in zip(TEST_COMMANDS, tester) if out['intent'] == expected)
+
+    val = predict_batch([item['text'] for item in val_data], *args)
+    val_intent = sum(1 for item, out in zip(val_data, val) if out['intent'] == item['intent'])
+    val_slots = sum(1 for item, out in zip(val_data, val) if slots_match(out['slots'], item['slots']))
+
+    latencies, _ = time_calls(lambda text: predict(text, *args), BENCHMARK_TEXTS)
+
+    return {
+        'tester': tester,
+        'tester_acc': tester_correct / len(TEST_COMMANDS),
+        'val': val,
+        'val_intent_acc': val_intent / len(val_data),
+        'val_slot_acc': val_slots / len(val_data),
+        'latency': latency_stats(latencies)
+    }
+
+
+def agreement(reference, candidate):
+    intents = sum(1 for a, b in zip(reference, candidate) if a['intent'] == b['intent'])
+    full = sum(1 for a, b in zip(reference, candidate) if a['intent'] == b['intent'] and a['slots'] == b['slots'])
+    return intents / len(reference), full / len(reference)
+
+
+def run_report(model_path=None):
+    val_data, dataset_path = load_validation_split()
+    print(f"Validation: {len(val_data)} utterances from {os.path.basename(dataset_path)}, threads: {torch.get_num_threads()}\n")
+
+    fp32_loader, fp32_results = load_model(model_path)
+    fp32 = evaluate(fp32_loader, val_data)
+    model_path = fp32_results['model']['model_path']
+    del fp32_loader
+
+    # Without a fresh cache the first int8 load quantizes the fp32 model and writes the cache;
+    # the second one always reads the cache into a meta-built skeleton, with no quantize_dynamic pass
+    int8_loader, int8_results = load_model(model_path, quantize=True)
+    _, cached_results = load_model(model_path, quantize=True)
+    int8 = evaluate(int8_loader, val_data)
+
+    print(f"Model: {model_path}\n")
+    rows = []
+    runs = (
+        ("fp32", fp32_results, fp32, SOURCE_WEIGHT_FILES),
+        ("int8", int8_results, int8, (QUANTIZED_FILENAME,))
+    )
+    for name, results, report, filenames in runs:
+        rows.append([
+            name,
+            f"{artifact_size_mb(model_path, filenames):.1f}",
+            f"{results['load_s']:.2f}",
+            f"{report['tester_acc']:.1%}",
+            f"{report['val_intent_acc']:.2%}",
+            f"{report['val_slot_acc']:.2%}",
+            f"{report['latency']['p50']:.2f}",
+            f"{report['latency']['p95']:.2f}"
+        ])
+    print_table(["model", "size MB", "load s", "tester", "val intent", "val slots", "p50 ms", "p95 ms"], rows)
+
+    tester_intent, tester_full = agreement(fp32['tester'], int8['tester'])
+    val_intent, val_full = agreement(fp32['val'], int8['val'])
+    print(f"\nint8 vs fp32 agreement (intent / intent+slots): "
+          f"tester {tester_intent:.1%} / {tester_full:.1%}, val {val_intent:.2%} / {val_full:.2%}")
+    print(f"int8 load: first {int8_results['load_s']:.2f}s ({int8_results['model']['quantized_from']}), "
+          f"then {cached_results['load_s']:.2f}s ({cached_results['model']['quantized_from']}), "
+          f"fp32 {fp32_results['load_s']:.2f}s")
+
+    for (text, _), a, b in zip(TEST_COMMANDS, fp32['tester'], int8['tester']):
+        if a['intent'] != b['intent'] or a['slots'] != b['slots']:
+            print(f"  differs: {text!r}: {a['intent']} {a['slots']} -> {b['intent']} {b['slots']}")
+
+
+if __name__ == "__main__":
+    run_report(model_path_from_argv())
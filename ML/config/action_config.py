@@ -0,0 +1,132 @@
+#INTENT -> X-PLANE ACTION SPEC
+# "command" actions pick a command per value of `slot` (`default` when the slot is missing).
+# A value with no command runs the `fallback` command if one is set, otherwise nothing
+# runs and `invalid_speech` (formatted with {slot} and {state}) is spoken.
+# "dataref" actions convert `slot` with `scale` after checking it lies in `range`,
+# optionally choosing the dataref by a `selector` slot (e.g. COM port).
+ACTIONS = {
+    "set_autopilot_heading": {
+        "type": "dataref",
+        "slot": "degrees",
+        "dataref": "sim/cockpit/autopilot/heading_mag",
+        "scale": 1,
+        "range": (0, 360),
+        "speech": "Setting heading to {value} degrees",
+        "invalid_speech": "Invalid heading value"
+    },
+    "set_autopilot_altitude": {
+        "type": "dataref",
+        "slot": "altitude",
+        "dataref": "sim/cockpit/autopilot/altitude",
+        "scale": 1,
+        "range": (0, 50000),
+        "speech": "Setting altitude to {value} feet",
+        "invalid_speech": "Invalid altitude value"
+    },
+    "set_flight_level": {
+        "type": "dataref",
+        "slot": "flight_level",
+        "dataref": "sim/cockpit/autopilot/altitude",
+        "scale": 100, # FL -> feet
+        "range": (10, 430),
+        "speech": "Setting flight level {value}",
+        "invalid_speech": "Invalid flight level"
+    },
+    "set_com_frequency": {
+        "type": "dataref",
+        "slot": "frequency",
+        "selector": "com_port",
+        "default_selector": "1",
+        "dataref": {
+            "1": "sim/cockpit/radios/com1_freq_hz",
+            "2": "sim/cockpit/radios/com2_freq_hz"
+        },
+        "scale": 1000000, # MHz -> Hz
+        "range": (118.0, 137.0),
+        "speech": "COM {selector} set to {value}",
+        "invalid_speech": "Invalid frequency"
+    },
+    "toggle_landing_gear": {
+        "type": "command",
+        "slot": "state",
+        "default": "toggle",
+        "fallback": "toggle",
+        "commands": {
+            "up": ("sim/flight_controls/landing_gear_up", "Gear up"),
+            "down": ("sim/flight_controls/landing_gear_down", "Gear down"),
+            "toggle": ("sim/flight_controls/landing_gear_toggle", None)
+        }
+    },
+    "toggle_flaps": {
+        "type": "command",
+        "slot": "state",
+        "default": "toggle",
+        "commands": {
+            "up": ("sim/flight_controls/flaps_up", "Flaps up"),
+            "down": ("sim/flight_controls/flaps_down", "Flaps down")
+        }
+    },
+    "toggle_autopilot_1": {
+        "type": "command",
+        "slot": "state",
+        "default": "toggle",
+        "commands": {
+            "on": ("sim/autopilot/servos_on", "Autopilot 1 on"),
+            "off": ("sim/autopilot/servos_toggle", "Autopilot 1 off")
+        }
+    },
+    "toggle_autopilot_2": {
+        "type": "command",
+        "slot": "state",
+        "default": "toggle",
+        "commands": {
+            "on": ("sim/autopilot/servos2_on", "Autopilot 2 on"),
+            "off": ("sim/autopilot/servos2_toggle", "Autopilot 2 off")
+        }
+    },
+    "toggle_flight_director_1": {
+        "type": "command",
+        "slot": "state",
+        "default": "toggle",
+        "commands": {
+            "on": ("sim/autopilot/fdir_on", "Flight Director 1 on"),
+            "off": ("sim/autopilot/fdir_toggle", "Flight Director 1 off")
+        }
+    },
+    "toggle_flight_director_2": {
+        "type": "command",
+        "slot": "state",
+        "default": "toggle",
+        "commands": {
+            "on": ("sim/autopilot/fdir2_on", "Flight Director 2 on"),
+            "off": ("sim/autopilot/fdir2_toggle", "Flight Director 2 off")
+        }
+    },
+    "toggle_parking_brake": {
+        "type": "command",
+        "slot": "state",
+        "default": "toggle",
+        "commands": {
+            "on": ("sim/flight_controls/park_brake_set", "Parking brake on"),
+            "off": ("sim/flight_controls/park_brake_release", "Parking brake off")
+        }
+    },
+    "toggle_engine_1": {
+        "type": "command",
+        "slot": "state",
+        "default": "toggle",
+        "commands": {
+            "on": ("sim/starters/engage_starter_1", "Engine 1 on"),
+            "off": ("sim/starters/shut_down_1", "Engine 1 off")
+        }
+    },
+    "toggle_engine_2": {
+        "type": "command",
+        "slot": "state",
+        "default": "toggle",
+        "commands": {
+            "on": ("sim/starters/engage_starter_2", "Engine 2 on"),
+            "off": ("sim/starters/shut_down_2", "Engine 2 off")
+        }
+    }
+}
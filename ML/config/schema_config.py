@@ -238,4 +238,8 @@ SCHEMA = {
         ],
         "slots": {}
     }
-}
\ No newline at end of file
+}
+
+#PHRASE VARIATIONS (PREFIXES AND SUFFIXES)
+PREFIXES = ["", "please", "could you", "request", "confirm", "go ahead and"]
+SUFFIXES = ["", "now", "immediately", "for me", "if you would"]
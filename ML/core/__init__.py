@@ -1,3 +1,5 @@
+import importlib
+
 from .normalization import (
     normalize_aviation_input,
     normalize_slot_value,
@@ -12,7 +14,6 @@ from .postprocessor import (
     extract_numbers_from_text,
     ACTION_STATE_MAP
 )
-from .model import JointIntentAndSlotModel
 
 __all__ = [
     'normalize_aviation_input',
@@ -29,5 +30,32 @@ __all__ = [
     'JointIntentAndSlotModel'
 ]
 
-from core.model_loader import ModelLoader
-from core.inference import predict, extract_slots, reconstruct_slot_value
\ No newline at end of file
+# Everything below needs torch or transformers, which take seconds to import.
+# They are resolved on first access (PEP 562) so text-only users of core,
+# such as the plugin at start-up, stay light.
+_LAZY_IMPORTS = {
+    'JointIntentAndSlotModel': 'core.model',
+    'ModelLoader': 'core.model_loader',
+    'predict': 'core.inference',
+    'predict_batch': 'core.inference',
+    'extract_slots': 'core.inference',
+    'extract_slots_batch': 'core.inference',
+    'reconstruct_slot_value': 'core.inference',
+    'decode_slots_batch': 'core.slot_decoding',
+    'build_tag_tables': 'core.slot_decoding',
+    'TemplateMatcher': 'core.template_matcher',
+    'InferenceSession': 'core.inference_session',
+    'configure_threads': 'core.inference_session'
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module 'core' has no attribute '{name}'")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
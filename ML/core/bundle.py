@@ -0,0 +1,136 @@
+import os
+import json
+import mmap
+import struct
+
+import torch
+
+from core.quantization import SOURCE_WEIGHT_FILES
+from utils import is_artifact_fresh
+
+
+BUNDLE_FILENAME = "model.bundle.safetensors"
+BUNDLE_FORMAT = "vimaan-nlu-bundle"
+BUNDLE_FORMAT_VERSION = 1
+MANIFEST_KEY = "vimaan_manifest"
+
+SAFETENSORS_DTYPES = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool
+}
+
+
+def export_bundle(model, tokenizer, intent_map, slot_map, output_path, source_path=None):
+    """Pack the encoder, both heads, the label maps and the tokenizer into one
+    safetensors file. Everything that is not a tensor goes in the manifest."""
+    from safetensors.torch import save_file
+
+    model = model.to("cpu").eval()
+    # Buffers too: position_ids is not in the state_dict but a meta-built model needs it
+    tensors = {name: tensor.detach().contiguous() for name, tensor in model.named_parameters()}
+    tensors.update({name: tensor.detach().contiguous() for name, tensor in model.named_buffers()})
+
+    manifest = {
+        'format': BUNDLE_FORMAT,
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'source': os.path.basename(os.path.normpath(source_path)) if source_path else None,
+        'config': model.bert_for_slots.config.to_dict(),
+        'intent_map': intent_map,
+        'slot_map': slot_map,
+        'tokenizer': tokenizer.backend_tokenizer.to_str(),
+        'special_tokens': tokenizer.special_tokens_map,
+        'model_max_length': tokenizer.model_max_length
+    }
+
+    tmp_path = output_path + ".tmp"
+    save_file(tensors, tmp_path, metadata={MANIFEST_KEY: json.dumps(manifest)})
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def bundle_is_fresh(model_path):
+    return is_artifact_fresh(model_path, BUNDLE_FILENAME, SOURCE_WEIGHT_FILES)
+
+
+def read_bundle(bundle_path):
+    """Map the bundle and return (manifest, tensors). The tensors are views into a
+    copy-on-write mapping of the file: nothing is read until a page is touched,
+    and untouched pages stay shared with the OS page cache."""
+    with open(bundle_path, "rb") as f:
+        header_size = struct.unpack("<Q", f.read(8))[0]
+        header = json.loads(f.read(header_size))
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    metadata = header.pop("__metadata__", None) or {}
+    if MANIFEST_KEY not in metadata:
+        raise ValueError(f"{bundle_path} is a safetensors file but not a Vimaan model bundle")
+    manifest = json.loads(metadata[MANIFEST_KEY])
+    if manifest.get('format_version') != BUNDLE_FORMAT_VERSION:
+        raise ValueError(
+            f"Bundle format version {manifest.get('format_version')} is not supported "
+            f"(expected {BUNDLE_FORMAT_VERSION}), re-export it with export_bundle.py"
+        )
+
+    data_start = 8 + header_size
+    tensors = {}
+    for name, info in header.items():
+        dtype = SAFETENSORS_DTYPES[info["dtype"]]
+        start, end = info["data_offsets"]
+        count = (end - start) // dtype.itemsize
+        tensor = torch.frombuffer(mapped, dtype=dtype, count=count, offset=data_start + start) if count else \
+            torch.empty(0, dtype=dtype)
+        tensors[name] = tensor.view(info["shape"])
+    return manifest, tensors
+
+
+def _assign_tensors(model, tensors):
+    for name, tensor in tensors.items():
+        module_name, _, attribute = name.rpartition(".")
+        module = model.get_submodule(module_name)
+        if attribute in module._parameters:
+            module._parameters[attribute] = torch.nn.Parameter(tensor, requires_grad=False)
+        elif attribute in module._buffers:
+            module._buffers[attribute] = tensor
+        else:
+            raise KeyError(f"Bundle tensor '{name}' does not exist in the model")
+
+    missing = [name for name, tensor in [*model.named_parameters(), *model.named_buffers()] if tensor.is_meta]
+    if missing:
+        raise KeyError(f"Bundle is missing tensors: {', '.join(missing)}")
+
+
+def load_bundle(bundle_path, device):
+    """Build the joint model and tokenizer from a bundle. The model skeleton is
+    created on the meta device, so no weights are allocated or initialised; the
+    parameters are the mapped tensors themselves (on CPU) or copies on `device`."""
+    # Deferred so checking for a bundle does not import the transformers modeling code
+    from tokenizers import Tokenizer
+    from transformers import DistilBertConfig, DistilBertTokenizerFast
+    from core.model import JointIntentAndSlotModel
+
+    manifest, tensors = read_bundle(bundle_path)
+    intent_map, slot_map = manifest['intent_map'], manifest['slot_map']
+
+    with torch.device("meta"):
+        model = JointIntentAndSlotModel(
+            num_intents=len(intent_map),
+            num_slots=len(slot_map),
+            config=DistilBertConfig.from_dict(manifest['config'])
+        )
+    _assign_tensors(model, tensors)
+    model = model.to(device).eval()
+
+    tokenizer = DistilBertTokenizerFast(
+        tokenizer_object=Tokenizer.from_str(manifest['tokenizer']),
+        model_max_length=manifest['model_max_length'],
+        **manifest['special_tokens']
+    )
+    return model, tokenizer, manifest
@@ -1,6 +1,11 @@
 import torch
 import numpy as np
 from core import normalize_aviation_input, postprocess_slots
+from core.slot_decoding import decode_slots_batch
+from utils import trace_stage
+
+
+MAX_SEQ_LENGTH = 64
 
 
 def reconstruct_slot_value(tokens):
@@ -60,34 +65,47 @@ def extract_slots(slot_pred_indices, tokens, slot_map_rev):
     return extracted_slots
 
 
-def predict(text, model, tokenizer, device, intent_map_rev, slot_map_rev, do_postprocess=True):
+def predict(text, model, tokenizer, device, intent_map_rev, slot_map_rev, do_postprocess=True, trace=None,
+            padding='longest', pad_to_multiple_of=None, text_normalized=None):
+    # Commands are a handful of tokens, so only pad to the real length (or a small
+    # bucket via pad_to_multiple_of); padding='max_length' reproduces the old fixed 64.
+    # Callers that already normalized (e.g. to look up a cache) pass text_normalized.
 
-    text_normalized = normalize_aviation_input(text)
-    
-    encoding = tokenizer(
-        text_normalized,
-        padding='max_length',
-        truncation=True,
-        max_length=64,
-        return_tensors='pt'
-    )
-    input_ids = encoding['input_ids'].to(device)
-    attention_mask = encoding['attention_mask'].to(device)
+    if text_normalized is None:
+        with trace_stage(trace, 'normalize'):
+            text_normalized = normalize_aviation_input(text)
     
-    with torch.no_grad():
-        _, intent_logits, slot_logits = model(input_ids, attention_mask)
+    with trace_stage(trace, 'tokenize'):
+        encoding = tokenizer(
+            text_normalized,
+            padding=padding,
+            truncation=True,
+            max_length=MAX_SEQ_LENGTH,
+            pad_to_multiple_of=pad_to_multiple_of,
+            return_offsets_mapping=True,
+            return_tensors='pt'
+        )
+        input_ids = encoding['input_ids'].to(device)
+        attention_mask = encoding['attention_mask'].to(device)
     
-    intent_pred_idx = torch.argmax(intent_logits, dim=1).item()
-    intent_pred = intent_map_rev[intent_pred_idx]
-    intent_confidence = torch.softmax(intent_logits, dim=1)[0, intent_pred_idx].item()
-    
-    slot_pred_indices = torch.argmax(slot_logits, dim=2)[0].cpu().numpy()
-    tokens = tokenizer.convert_ids_to_tokens(input_ids[0].cpu().numpy())
+    with trace_stage(trace, 'forward'):
+        with torch.no_grad():
+            _, intent_logits, slot_logits = model(input_ids, attention_mask)
+        
+        intent_pred_idx = torch.argmax(intent_logits, dim=1).item()
+        intent_pred = intent_map_rev[intent_pred_idx]
+        intent_confidence = torch.softmax(intent_logits, dim=1)[0, intent_pred_idx].item()
+        
+        slot_pred_indices = torch.argmax(slot_logits, dim=2).cpu().numpy()
     
-    extracted_slots = extract_slots(slot_pred_indices, tokens, slot_map_rev)
+    with trace_stage(trace, 'extract_slots'):
+        extracted_slots = decode_slots_batch(
+            slot_pred_indices, encoding['offset_mapping'].numpy(), [text_normalized], slot_map_rev
+        )[0]
     
     if do_postprocess:
-        extracted_slots = postprocess_slots(extracted_slots, text_normalized, intent_pred)
+        with trace_stage(trace, 'postprocess'):
+            extracted_slots = postprocess_slots(extracted_slots, text_normalized, intent_pred)
     
     return {
         'intent': intent_pred,
@@ -95,4 +113,63 @@ def predict(text, model, tokenizer, device, intent_map_rev, slot_map_rev, do_pos
         'confidence': intent_confidence,
         'original_text': text,
         'normalized_text': text_normalized
-    }
\ No newline at end of file
+    }
+
+def extract_slots_batch(slot_pred_indices, input_ids, attention_mask, tokenizer, slot_map_rev):
+    lengths = attention_mask.sum(axis=1)
+    # One vocabulary lookup for the whole batch, then per-row BIO decoding
+    flat_tokens = tokenizer.convert_ids_to_tokens(input_ids.reshape(-1).tolist())
+    width = input_ids.shape[1]
+    
+    batch_slots = []
+    for row, length in enumerate(lengths):
+        tokens = flat_tokens[row * width:row * width + int(length)]
+        batch_slots.append(extract_slots(slot_pred_indices[row][:int(length)], tokens, slot_map_rev))
+    return batch_slots
+
+
+def predict_batch(texts, model, tokenizer, device, intent_map_rev, slot_map_rev, do_postprocess=True,
+                  batch_size=64, pad_to_multiple_of=None):
+    results = []
+    
+    for start in range(0, len(texts), batch_size):
+        batch_texts = texts[start:start + batch_size]
+        batch_normalized = [normalize_aviation_input(text) for text in batch_texts]
+        
+        encoding = tokenizer(
+            batch_normalized,
+            padding='longest',
+            truncation=True,
+            max_length=MAX_SEQ_LENGTH,
+            pad_to_multiple_of=pad_to_multiple_of,
+            return_offsets_mapping=True,
+            return_tensors='pt'
+        )
+        input_ids = encoding['input_ids'].to(device)
+        attention_mask = encoding['attention_mask'].to(device)
+        
+        with torch.no_grad():
+            _, intent_logits, slot_logits = model(input_ids, attention_mask)
+        
+        intent_confidences, intent_pred_indices = torch.softmax(intent_logits, dim=1).max(dim=1)
+        slot_pred_indices = torch.argmax(slot_logits, dim=2).cpu().numpy()
+        
+        batch_slots = decode_slots_batch(
+            slot_pred_indices, encoding['offset_mapping'].numpy(), batch_normalized, slot_map_rev
+        )
+        
+        for i, text in enumerate(batch_texts):
+            intent_pred = intent_map_rev[int(intent_pred_indices[i])]
+            extracted_slots = batch_slots[i]
+            if do_postprocess:
+                extracted_slots = postprocess_slots(extracted_slots, batch_normalized[i], intent_pred)
+            
+            results.append({
+                'intent': intent_pred,
+                'slots': extracted_slots,
+                'confidence': intent_confidences[i].item(),
+                'original_text': text,
+                'normalized_text': batch_normalized[i]
+            })
+    
+    return results
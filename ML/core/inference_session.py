@@ -0,0 +1,146 @@
+import threading
+
+import torch
+
+from core.normalization import normalize_aviation_input
+from core.postprocessor import postprocess_slots
+from core.inference import MAX_SEQ_LENGTH
+from core.slot_decoding import decode_slots_batch, build_tag_tables
+from utils import trace_stage
+
+
+def configure_threads(intra_op_threads=None, inter_op_threads=None):
+    # Torch thread pools are process-wide; the inter-op pool can only be sized
+    # before its first use, so a late call keeps whatever is already running
+    if intra_op_threads:
+        torch.set_num_threads(intra_op_threads)
+    if inter_op_threads:
+        try:
+            torch.set_num_interop_threads(inter_op_threads)
+        except RuntimeError:
+            pass
+    return {'intra_op_threads': torch.get_num_threads(), 'inter_op_threads': torch.get_num_interop_threads()}
+
+
+class InferenceSession:
+    """Reusable inference state for one loaded model: input buffers allocated
+    once on the model's device and cached BIO tag tables, so a command only
+    pays for tokenization and the forward pass. Thread pools are sized by
+    ModelLoader. Results match core.inference.predict / predict_batch."""
+
+    def __init__(self, model, tokenizer, device, intent_map_rev, slot_map_rev, max_batch_size=64):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.device = device
+        self.intent_map_rev = intent_map_rev
+        self.slot_map_rev = slot_map_rev
+        self.max_batch_size = max_batch_size
+        self.tag_tables = build_tag_tables(slot_map_rev)
+        # The worker and the speculative interpreter share one session and its buffers
+        self.lock = threading.Lock()
+
+        # Flat buffers so every [batch, length] view of them is contiguous
+        size = max_batch_size * MAX_SEQ_LENGTH
+        self.input_ids = torch.zeros(size, dtype=torch.long, device=device)
+        self.attention_mask = torch.zeros(size, dtype=torch.long, device=device)
+
+        # Outputs are written in place with out=; on CUDA they are copied into pinned host
+        # buffers, on CPU the device buffers are read directly
+        self.outputs = self._output_buffers(max_batch_size, size, device)
+        self.host_outputs = self.outputs if device.type != 'cuda' else \
+            self._output_buffers(max_batch_size, size, torch.device('cpu'), pin_memory=True)
+
+    @staticmethod
+    def _output_buffers(max_batch_size, size, device, pin_memory=False):
+        return (
+            torch.zeros(max_batch_size, dtype=torch.float, device=device, pin_memory=pin_memory),
+            torch.zeros(max_batch_size, dtype=torch.long, device=device, pin_memory=pin_memory),
+            torch.zeros(size, dtype=torch.long, device=device, pin_memory=pin_memory)
+        )
+
+    @staticmethod
+    def _views(buffers, batch, length):
+        confidences, intent_indices, slot_indices = buffers
+        return confidences[:batch], intent_indices[:batch], slot_indices[:batch * length].view(batch, length)
+
+    def _encode(self, texts_normalized):
+        encoding = self.tokenizer(
+            texts_normalized,
+            padding='longest',
+            truncation=True,
+            max_length=MAX_SEQ_LENGTH,
+            return_offsets_mapping=True,
+            return_tensors='np'
+        )
+        batch, length = encoding['input_ids'].shape
+        input_ids = self.input_ids[:batch * length].view(batch, length)
+        attention_mask = self.attention_mask[:batch * length].view(batch, length)
+        input_ids.copy_(torch.from_numpy(encoding['input_ids']), non_blocking=True)
+        attention_mask.copy_(torch.from_numpy(encoding['attention_mask']), non_blocking=True)
+        return input_ids, attention_mask, encoding['offset_mapping']
+
+    def _forward(self, input_ids, attention_mask):
+        # The returned arrays are views of the session buffers: read them before releasing the lock
+        batch, length = input_ids.shape
+        outputs = self._views(self.outputs, batch, length)
+        with torch.inference_mode():
+            _, intent_logits, slot_logits = self.model(input_ids, attention_mask)
+            torch.max(torch.softmax(intent_logits, dim=1), dim=1, out=outputs[:2])
+            torch.argmax(slot_logits, dim=2, out=outputs[2])
+        if self.host_outputs is self.outputs:
+            return tuple(output.numpy() for output in outputs)
+        host_outputs = self._views(self.host_outputs, batch, length)
+        for host, output in zip(host_outputs, outputs):
+            host.copy_(output)
+        return tuple(host.numpy() for host in host_outputs)
+
+    def _results(self, texts, texts_normalized, confidences, intent_indices, batch_slots, do_postprocess, trace=None):
+        results = []
+        for i, text in enumerate(texts):
+            intent = self.intent_map_rev[int(intent_indices[i])]
+            slots = batch_slots[i]
+            if do_postprocess:
+                with trace_stage(trace, 'postprocess'):
+                    slots = postprocess_slots(slots, texts_normalized[i], intent)
+            results.append({
+                'intent': intent,
+                'slots': slots,
+                'confidence': float(confidences[i]),
+                'original_text': text,
+                'normalized_text': texts_normalized[i]
+            })
+        return results
+
+    def predict(self, text, do_postprocess=True, trace=None, text_normalized=None):
+        if text_normalized is None:
+            with trace_stage(trace, 'normalize'):
+                text_normalized = normalize_aviation_input(text)
+
+        with self.lock:
+            with trace_stage(trace, 'tokenize'):
+                input_ids, attention_mask, offsets = self._encode([text_normalized])
+
+            with trace_stage(trace, 'forward'):
+                confidences, intent_indices, slot_indices = self._forward(input_ids, attention_mask)
+
+            with trace_stage(trace, 'extract_slots'):
+                batch_slots = decode_slots_batch(slot_indices, offsets, [text_normalized], self.slot_map_rev, self.tag_tables)
+            confidences, intent_indices = confidences.tolist(), intent_indices.tolist()
+
+        return self._results([text], [text_normalized], confidences, intent_indices, batch_slots, do_postprocess, trace)[0]
+
+    def predict_batch(self, texts, do_postprocess=True, batch_size=None):
+        batch_size = min(batch_size or self.max_batch_size, self.max_batch_size)
+        results = []
+        for start in range(0, len(texts), batch_size):
+            batch_texts = texts[start:start + batch_size]
+            batch_normalized = [normalize_aviation_input(text) for text in batch_texts]
+            with self.lock:
+                input_ids, attention_mask, offsets = self._encode(batch_normalized)
+                confidences, intent_indices, slot_indices = self._forward(input_ids, attention_mask)
+                batch_slots = decode_slots_batch(slot_indices, offsets, batch_normalized, self.slot_map_rev, self.tag_tables)
+                confidences, intent_indices = confidences.tolist(), intent_indices.tolist()
+            results.extend(self._results(
+                batch_texts, batch_normalized, confidences, intent_indices, batch_slots, do_postprocess
+            ))
+        return results
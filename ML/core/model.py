@@ -3,11 +3,19 @@ from transformers import DistilBertForTokenClassification
 
 
 class JointIntentAndSlotModel(torch.nn.Module):
-    def __init__(self, num_intents, num_slots):
+    def __init__(self, num_intents, num_slots, config=None, bert_for_slots=None):
         super().__init__()
-        self.bert_for_slots = DistilBertForTokenClassification.from_pretrained(
-            'distilbert-base-uncased', num_labels=num_slots
-        )
+        if bert_for_slots is not None:
+            # Already-loaded fine-tuned encoder, so the base checkpoint is never touched
+            self.bert_for_slots = bert_for_slots
+        elif config is None:
+            self.bert_for_slots = DistilBertForTokenClassification.from_pretrained(
+                'distilbert-base-uncased', num_labels=num_slots
+            )
+        else:
+            # Randomly initialised encoder of any size, e.g. a distilled student
+            config.num_labels = num_slots
+            self.bert_for_slots = DistilBertForTokenClassification(config)
         self.intent_classifier = torch.nn.Linear(
             self.bert_for_slots.config.hidden_size, num_intents
         )
@@ -1,17 +1,37 @@
 import os
 import json
 import torch
-from transformers import DistilBertForTokenClassification, DistilBertTokenizerFast
 
-from core import JointIntentAndSlotModel
+from core.onnx_backend import OnnxJointModel, ONNX_FILENAME
+from core.quantization import quantize_model, quantized_cache_is_fresh, load_quantized, save_quantized
+from core.torchscript_backend import TorchScriptJointModel, TORCHSCRIPT_FILENAME, torchscript_is_fresh
+from core.inference_session import InferenceSession, configure_threads
+from core.bundle import BUNDLE_FILENAME, bundle_is_fresh, load_bundle
 from utils import get_latest_model_path
 
 
 class ModelLoader:
     
-    def __init__(self, device=None):
+    BACKENDS = ('torch', 'onnx')
+    
+    def __init__(self, device=None, backend='torch', quantize=False, cache_quantized=True, use_torchscript=True,
+                 use_bundle=True, intra_op_threads=None, inter_op_threads=None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {self.BACKENDS}")
+        
+        self.backend = backend
+        self.quantize = quantize and backend == 'torch'
+        self.cache_quantized = cache_quantized
+        self.use_torchscript = use_torchscript and backend == 'torch' and not self.quantize
+        self.use_bundle = use_bundle and backend == 'torch'
+        # ONNX Runtime and dynamic int8 quantization only run on CPU
+        if backend == 'onnx' or self.quantize:
+            device = torch.device("cpu")
         self.device = device or torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
         self.model = None
+        self.session = None
         self.tokenizer = None
         self.intent_map = None
         self.slot_map = None
@@ -20,11 +40,16 @@ class ModelLoader:
     
     def load_maps(self, model_path):
         with open(f"{model_path}/intent_map.json", "r") as f:
-            self.intent_map = json.load(f)
+            intent_map = json.load(f)
         
         with open(f"{model_path}/slot_map.json", "r") as f:
-            self.slot_map = json.load(f)
+            slot_map = json.load(f)
         
+        return self._set_maps(intent_map, slot_map)
+    
+    def _set_maps(self, intent_map, slot_map):
+        self.intent_map = intent_map
+        self.slot_map = slot_map
         self.intent_map_rev = {v: k for k, v in self.intent_map.items()}
         self.slot_map_rev = {v: k for k, v in self.slot_map.items()}
         
@@ -39,13 +64,52 @@ class ModelLoader:
         
         dims = self.load_maps(model_path)
         
+        if self.backend == 'onnx':
+            self.model = OnnxJointModel(
+                os.path.join(model_path, ONNX_FILENAME),
+                intra_op_threads=self.intra_op_threads,
+                inter_op_threads=self.inter_op_threads
+            )
+            return self._model_info(model_path, dims, model_format='onnx')
+        
+        torchscript_error = None
+        if self.use_torchscript and torchscript_is_fresh(model_path):
+            try:
+                self.model = TorchScriptJointModel(os.path.join(model_path, TORCHSCRIPT_FILENAME), self.device)
+                return self._model_info(model_path, dims, model_format='torchscript')
+            except RuntimeError as e:
+                # A trace from another torch build can fail to deserialize; the eager path still works
+                torchscript_error = str(e)
+        
+        # The transformers modeling code costs seconds to import, and the TorchScript
+        # and ONNX paths above never need it
+        from transformers import DistilBertConfig, DistilBertForTokenClassification
+        from core.model import JointIntentAndSlotModel
+        
+        # Everything is built from the saved config.json; the distilbert-base-uncased
+        # checkpoint is only needed for training, never for loading a fine-tuned model
+        if self.quantize and self.cache_quantized and quantized_cache_is_fresh(model_path):
+            # Architecture only, on the meta device: the fp32 checkpoint is never read,
+            # no weights are initialised and the int8 modules are filled from the cache
+            with torch.device("meta"):
+                skeleton = JointIntentAndSlotModel(
+                    num_intents=dims['intents'],
+                    num_slots=dims['slots'],
+                    config=DistilBertConfig.from_pretrained(model_path)
+                )
+            try:
+                self.model = load_quantized(skeleton, model_path)
+                return self._model_info(model_path, dims, quantized_from='cache')
+            except ValueError:
+                # Cache written by an older layout; rebuilt from fp32 below
+                pass
+        
         self.model = JointIntentAndSlotModel(
             num_intents=dims['intents'],
-            num_slots=dims['slots']
+            num_slots=dims['slots'],
+            bert_for_slots=DistilBertForTokenClassification.from_pretrained(model_path)
         )
         
-        self.model.bert_for_slots = DistilBertForTokenClassification.from_pretrained(model_path)
-        
         intent_classifier_path = os.path.join(model_path, "intent_classifier.bin")
         if os.path.exists(intent_classifier_path):
             intent_classifier_state = torch.load(intent_classifier_path, map_location=self.device)
@@ -56,14 +120,54 @@ class ModelLoader:
         self.model = self.model.to(self.device)
         self.model.eval()
         
+        if self.quantize:
+            self.model = quantize_model(self.model)
+            if self.cache_quantized:
+                save_quantized(self.model, model_path)
+            return self._model_info(model_path, dims, quantized_from='fp32')
+        
+        return self._model_info(model_path, dims, torchscript_error=torchscript_error)
+    
+    def _model_info(self, model_path, dims, quantized_from=None, model_format='eager', torchscript_error=None):
         return {
             'model_path': model_path,
             'device': str(self.device),
+            'backend': self.backend,
+            'format': model_format,
+            'torchscript_error': torchscript_error,
+            'quantized': self.quantize,
+            'quantized_from': quantized_from,
             'intents_loaded': dims['intents'],
             'slots_loaded': dims['slots']
         }
     
+    def bundle_path(self, model_path):
+        # An explicit bundle file is always used; inside a vN directory a fresh bundle
+        # replaces the directory files unless a TorchScript trace or int8 cache is preferred
+        if os.path.isfile(model_path):
+            return model_path
+        if not self.use_bundle or self.quantize or not bundle_is_fresh(model_path):
+            return None
+        if self.use_torchscript and torchscript_is_fresh(model_path):
+            return None
+        return os.path.join(model_path, BUNDLE_FILENAME)
+    
+    def load_bundle(self, bundle_path, model_path=None):
+        if self.backend != 'torch':
+            raise ValueError(f"Model bundles are loaded with the torch backend, not '{self.backend}'")
+        
+        self.model, self.tokenizer, manifest = load_bundle(bundle_path, self.device)
+        dims = self._set_maps(manifest['intent_map'], manifest['slot_map'])
+        
+        quantized_from = None
+        if self.quantize:
+            # A standalone bundle has no vN directory to keep an int8 cache in
+            self.model = quantize_model(self.model)
+            quantized_from = 'bundle'
+        return self._model_info(model_path or bundle_path, dims, quantized_from=quantized_from, model_format='bundle')
+    
     def load_tokenizer(self, model_path):
+        from transformers import DistilBertTokenizerFast
         self.tokenizer = DistilBertTokenizerFast.from_pretrained(model_path)
         return {'tokenizer_loaded': True}
     
@@ -72,15 +176,34 @@ class ModelLoader:
             model_path = get_latest_model_path()
         
         if not model_path:
-            raise FileNotFoundError("No model path provided and no latest model found")
+            raise FileNotFoundError("No model path provided and no promoted model in the registry")
+        
+        # Set before loading: the inter-op pool can only be sized ahead of its first use
+        threads = configure_threads(self.intra_op_threads, self.inter_op_threads)
+        
+        bundle_path = self.bundle_path(model_path)
+        if bundle_path:
+            model_info = self.load_bundle(bundle_path, model_path)
+            tokenizer_info = {'tokenizer_loaded': True}
+        else:
+            model_info = self.load_model(model_path)
+            tokenizer_info = self.load_tokenizer(model_path)
         
         results = {
-            'model': self.load_model(model_path),
-            'tokenizer': self.load_tokenizer(model_path),
+            'model': model_info,
+            'tokenizer': tokenizer_info,
             'maps': {
                 'intents': len(self.intent_map),
                 'slots': len(self.slot_map)
-            }
+            },
+            'threads': threads
         }
         
-        return results
\ No newline at end of file
+        self.session = self.create_session()
+        return results
+    
+    def create_session(self, max_batch_size=64):
+        return InferenceSession(
+            self.model, self.tokenizer, self.device, self.intent_map_rev, self.slot_map_rev,
+            max_batch_size=max_batch_size
+        )
\ No newline at end of file
@@ -2,12 +2,9 @@ import re
 
 try:
     from word2number import w2n
-except ImportError:
-    print("Installing word2number...")
-    import subprocess
-    import sys
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "word2number"])
-    from word2number import w2n
+except ImportError as e:
+    # Importing the package must not install anything, just say what is missing
+    raise ImportError("core.normalization needs word2number (pip install word2number)") from e
 
 
 PHONETIC_MAP = {
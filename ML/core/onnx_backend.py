@@ -0,0 +1,85 @@
+import os
+
+import numpy as np
+import torch
+
+
+ONNX_FILENAME = "model.onnx"
+
+
+class _ExportWrapper(torch.nn.Module):
+    # Exposes only the two logit heads so the graph has plain tensor outputs
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        _, intent_logits, slot_logits = self.model(input_ids, attention_mask)
+        return intent_logits, slot_logits
+
+
+def export_onnx(model, tokenizer, output_path, opset_version=17):
+    model = model.to("cpu").eval()
+    example = tokenizer(["set com 1 to 121.5", "gear up"], padding='longest', return_tensors='pt')
+
+    torch.onnx.export(
+        _ExportWrapper(model),
+        (example['input_ids'], example['attention_mask']),
+        output_path,
+        input_names=['input_ids', 'attention_mask'],
+        output_names=['intent_logits', 'slot_logits'],
+        dynamic_axes={
+            'input_ids': {0: 'batch', 1: 'sequence'},
+            'attention_mask': {0: 'batch', 1: 'sequence'},
+            'intent_logits': {0: 'batch'},
+            'slot_logits': {0: 'batch', 1: 'sequence'}
+        },
+        opset_version=opset_version
+    )
+    
+    # Newer exporters write weights to a sidecar file; fold them back into one graph file
+    data_path = output_path + ".data"
+    if os.path.exists(data_path):
+        import onnx
+        graph = onnx.load(output_path)
+        onnx.save_model(graph, output_path)
+        os.remove(data_path)
+    return output_path
+
+
+class OnnxJointModel:
+    """ONNX Runtime stand-in for JointIntentAndSlotModel at inference time.
+    Called like the torch model and returns (loss, intent_logits, slot_logits)
+    as CPU tensors, so predict/predict_batch work unchanged."""
+
+    def __init__(self, onnx_path, intra_op_threads=None, inter_op_threads=None):
+        if not os.path.exists(onnx_path):
+            raise FileNotFoundError(f"ONNX model not found at {onnx_path}, run export_onnx.py first")
+
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        if inter_op_threads:
+            options.inter_op_num_threads = inter_op_threads
+
+        self.onnx_path = onnx_path
+        self.session = ort.InferenceSession(onnx_path, options, providers=['CPUExecutionProvider'])
+
+    def __call__(self, input_ids, attention_mask):
+        intent_logits, slot_logits = self.session.run(
+            None,
+            {
+                'input_ids': np.asarray(input_ids.cpu(), dtype=np.int64),
+                'attention_mask': np.asarray(attention_mask.cpu(), dtype=np.int64)
+            }
+        )
+        return 0, torch.from_numpy(intent_logits), torch.from_numpy(slot_logits)
+
+    def eval(self):
+        return self
+
+    def to(self, device):
+        return self
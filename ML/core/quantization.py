@@ -0,0 +1,127 @@
+import os
+from collections import OrderedDict
+
+import torch
+
+from utils import is_artifact_fresh
+
+
+QUANTIZED_FILENAME = "quantized_int8.pt"
+# Bumped when the cache layout changes; older caches are rebuilt from the fp32 checkpoint
+QUANTIZED_FORMAT_VERSION = 2
+SOURCE_WEIGHT_FILES = ("model.safetensors", "pytorch_model.bin", "intent_classifier.bin")
+
+
+def quantize_model(model):
+    # Dynamic int8: Linear weights are stored as int8, activations quantized on the fly (CPU only)
+    model = model.to("cpu").eval()
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def quantized_cache_is_fresh(model_path):
+    return is_artifact_fresh(model_path, QUANTIZED_FILENAME, SOURCE_WEIGHT_FILES)
+
+
+def _pack_tensor(tensor):
+    if not tensor.is_quantized:
+        return tensor
+    # Store int8 data plus quantization params as plain tensors; pickling qtensors makes
+    # the pickler scan sys.modules, which drags in every lazy transformers submodule
+    packed = {'int_repr': tensor.int_repr()}
+    if tensor.qscheme() == torch.per_channel_affine:
+        packed.update(scales=tensor.q_per_channel_scales(),
+                      zero_points=tensor.q_per_channel_zero_points(),
+                      axis=torch.tensor(tensor.q_per_channel_axis()))
+    else:
+        packed.update(scale=torch.tensor(tensor.q_scale(), dtype=torch.float64),
+                      zero_point=torch.tensor(tensor.q_zero_point()))
+    return packed
+
+
+def _unpack_tensor(packed):
+    if not isinstance(packed, dict):
+        return packed
+    if 'axis' in packed:
+        return torch._make_per_channel_quantized_tensor(
+            packed['int_repr'], packed['scales'], packed['zero_points'], int(packed['axis']))
+    return torch._make_per_tensor_quantized_tensor(
+        packed['int_repr'], float(packed['scale']), int(packed['zero_point']))
+
+
+def _pack_state(state):
+    packed = {}
+    for key, value in state.items():
+        if isinstance(value, tuple):
+            packed[key] = {'tuple': [_pack_tensor(v) if torch.is_tensor(v) else v for v in value]}
+        elif isinstance(value, torch.dtype):
+            packed[key] = {'dtype': str(value).replace("torch.", "")}
+        else:
+            packed[key] = _pack_tensor(value)
+    return packed
+
+
+def _unpack_state(packed):
+    state = OrderedDict()
+    for key, value in packed.items():
+        if isinstance(value, dict) and 'tuple' in value:
+            state[key] = tuple(_unpack_tensor(v) if v is not None else v for v in value['tuple'])
+        elif isinstance(value, dict) and 'dtype' in value:
+            state[key] = getattr(torch, value['dtype'])
+        else:
+            state[key] = _unpack_tensor(value)
+    return state
+
+
+def _dynamic_linear(linear, weight, bias):
+    # Built 1x1 and resized so the int8 weight is packed once, from the cached tensors,
+    # instead of once for placeholder weights and again on load
+    module = torch.ao.nn.quantized.dynamic.Linear(1, 1, bias_=linear.bias is not None, dtype=torch.qint8)
+    module.in_features, module.out_features = linear.in_features, linear.out_features
+    module.set_weight_bias(weight, bias)
+    return module
+
+
+def load_quantized(skeleton, model_path):
+    """skeleton is the architecture built on the meta device: no fp32 weights are
+    allocated or initialised, and quantize_dynamic is never run on this path."""
+    packed = torch.load(os.path.join(model_path, QUANTIZED_FILENAME), map_location="cpu", weights_only=True)
+    if packed.get('format_version') != QUANTIZED_FORMAT_VERSION:
+        raise ValueError(f"{QUANTIZED_FILENAME} has an old layout, it will be rebuilt")
+
+    model = skeleton
+    state = _unpack_state(packed['state'])
+    linears = [(name, module) for name, module in model.named_modules() if isinstance(module, torch.nn.Linear)]
+    for name, linear in linears:
+        weight, bias = state.pop(f"{name}._packed_params._packed_params")
+        for key in ("scale", "zero_point", "_packed_params.dtype"):
+            state.pop(f"{name}.{key}")
+        parent_name, _, attribute = name.rpartition(".")
+        setattr(model.get_submodule(parent_name), attribute, _dynamic_linear(linear, weight, bias))
+
+    # The rest (embeddings, LayerNorms, and non-persistent buffers such as position_ids,
+    # which are not in the state_dict) replaces the meta tensors instead of being copied into them
+    for name, tensor in {**state, **packed['buffers']}.items():
+        module_name, _, attribute = name.rpartition(".")
+        module = model.get_submodule(module_name)
+        if attribute in module._parameters:
+            module._parameters[attribute] = torch.nn.Parameter(tensor, requires_grad=False)
+        else:
+            module._buffers[attribute] = tensor
+
+    missing = [name for name, tensor in [*model.named_parameters(), *model.named_buffers()] if tensor.is_meta]
+    if missing:
+        raise ValueError(f"{QUANTIZED_FILENAME} is missing tensors: {', '.join(missing)}")
+    return model.eval()
+
+
+def save_quantized(model, model_path):
+    cache_path = os.path.join(model_path, QUANTIZED_FILENAME)
+    tmp_path = cache_path + ".tmp"
+    state = model.state_dict()
+    torch.save({
+        'format_version': QUANTIZED_FORMAT_VERSION,
+        'state': _pack_state(state),
+        'buffers': {name: tensor for name, tensor in model.named_buffers() if name not in state}
+    }, tmp_path)
+    os.replace(tmp_path, cache_path)
+    return cache_path
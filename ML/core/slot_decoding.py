@@ -0,0 +1,65 @@
+import numpy as np
+
+
+def build_tag_tables(slot_map_rev):
+    # Lookup arrays indexed by tag id: is it a B-/I- tag, and which slot name it belongs to
+    size = max(slot_map_rev) + 1
+    begins = np.zeros(size, dtype=bool)
+    inside = np.zeros(size, dtype=bool)
+    names = np.full(size, -1, dtype=np.int64)
+    slot_names = []
+
+    for idx, tag in slot_map_rev.items():
+        if not tag.startswith(("B-", "I-")):
+            continue
+        name = tag[2:]
+        if name not in slot_names:
+            slot_names.append(name)
+        names[idx] = slot_names.index(name)
+        begins[idx] = tag.startswith("B-")
+        inside[idx] = tag.startswith("I-")
+
+    return begins, inside, names, slot_names
+
+
+def decode_slots_batch(slot_pred_indices, offset_mapping, texts, slot_map_rev, tag_tables=None):
+    """BIO-decode a batch of argmax tags into {slot: value} dicts.
+
+    Spans are a B-X tag followed by consecutive I-X tags; orphan I- tags are
+    dropped. Values are sliced from the text the tokenizer saw using the fast
+    tokenizer's offset mapping, so no token strings are rebuilt."""
+    tags = np.asarray(slot_pred_indices)
+    offsets = np.asarray(offset_mapping)
+    begins, inside, names, slot_names = tag_tables or build_tag_tables(slot_map_rev)
+
+    # Special and padding tokens map to empty (0, 0) character spans
+    valid = offsets[..., 1] > offsets[..., 0]
+    tag_names = names[tags]
+    is_begin = begins[tags] & valid
+
+    prev_names = np.full_like(tag_names, -1)
+    prev_names[:, 1:] = tag_names[:, :-1]
+    prev_valid = np.zeros_like(valid)
+    prev_valid[:, 1:] = valid[:, :-1]
+    continues = inside[tags] & valid & prev_valid & (tag_names == prev_names)
+
+    # Every token that does not continue the previous one heads a segment; segments
+    # headed by a B- tag are the slot spans. Row starts never continue, so spans
+    # cannot cross rows of the flattened batch.
+    flat_continues = continues.ravel()
+    heads = np.flatnonzero(~flat_continues)
+    ends = np.append(heads[1:], flat_continues.size) - 1
+    is_span = is_begin.ravel()[heads]
+    starts, stops = heads[is_span], ends[is_span]
+
+    width = tags.shape[1]
+    flat_offsets = offsets.reshape(-1, 2)
+    rows = (starts // width).tolist()
+    span_names = tag_names.ravel()[starts].tolist()
+    char_starts = flat_offsets[starts, 0].tolist()
+    char_ends = flat_offsets[stops, 1].tolist()
+
+    batch_slots = [{} for _ in range(tags.shape[0])]
+    for row, name, char_start, char_end in zip(rows, span_names, char_starts, char_ends):
+        batch_slots[row][slot_names[name]] = texts[row][char_start:char_end]
+    return batch_slots
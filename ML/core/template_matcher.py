@@ -0,0 +1,184 @@
+import re
+import threading
+
+from core.normalization import normalize_aviation_input
+from core.postprocessor import postprocess_slots
+from config.schema_config import SCHEMA, PREFIXES, SUFFIXES
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[.'-][a-z0-9]+)*")
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+DIGITS_PATTERN = re.compile(r"\d+")
+FREQUENCY_PATTERN = re.compile(r"\d{3}\.\d{1,3}")
+COM_FREQUENCY_RANGE = (118.0, 137.0)
+
+
+def tokenize(text):
+    # Punctuation around words ("now?", "1300.") is dropped, inside numbers and words it is kept
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SlotMatcher:
+    """Matches one slot value at a token position and returns (value, tokens used)."""
+
+    def __init__(self, name, details):
+        self.name = name
+        self.surface_forms = []
+        self.numeric_range = None
+        self.frequency = False
+
+        values = details.get("values", [])
+        if values == ["<DYNAMIC>"]:
+            self.frequency = name == "frequency"
+        elif details.get("type") == "numerical":
+            numbers = [int(v) for v in values]
+            self.numeric_range = (min(numbers), max(numbers))
+        else:
+            forms = {value: value for value in values}
+            for value, synonyms in details.get("synonyms", {}).items():
+                for synonym in synonyms:
+                    forms.setdefault(synonym, value)
+            # Longest forms first so "shut down" wins over a one-word form
+            self.surface_forms = sorted(
+                ((tuple(tokenize(form)), value) for form, value in forms.items()),
+                key=lambda item: len(item[0]),
+                reverse=True
+            )
+
+    @property
+    def supported(self):
+        return bool(self.surface_forms) or self.numeric_range is not None or self.frequency
+
+    def match(self, tokens, position):
+        if position >= len(tokens):
+            return []
+        token = tokens[position]
+
+        if self.numeric_range is not None:
+            if DIGITS_PATTERN.fullmatch(token) and self.numeric_range[0] <= int(token) <= self.numeric_range[1]:
+                return [(token, 1)]
+            return []
+
+        if self.frequency:
+            if FREQUENCY_PATTERN.fullmatch(token) and COM_FREQUENCY_RANGE[0] <= float(token) <= COM_FREQUENCY_RANGE[1]:
+                return [(token, 1)]
+            return []
+
+        matches = []
+        for form, value in self.surface_forms:
+            if tuple(tokens[position:position + len(form)]) == form:
+                matches.append((value, len(form)))
+        return matches
+
+
+class TemplateNode:
+    __slots__ = ("literals", "slots", "intents")
+
+    def __init__(self):
+        self.literals = {}
+        self.slots = {}
+        self.intents = set()
+
+
+class TemplateMatcher:
+    """Token trie compiled from the SCHEMA templates, wrapped in the PREFIXES and
+    SUFFIXES the training data was generated with. A command that matches exactly
+    one (intent, slots) reading is resolved without the transformer; anything
+    else, including phrases shared by two intents, is left to the model."""
+
+    def __init__(self, schema=SCHEMA, prefixes=PREFIXES, suffixes=SUFFIXES):
+        self.root = TemplateNode()
+        self.prefixes = sorted({tuple(tokenize(normalize_aviation_input(p))) for p in prefixes}, key=len)
+        self.suffixes = sorted({tuple(tokenize(normalize_aviation_input(s))) for s in suffixes}, key=len)
+        self.templates = 0
+        self.skipped = []
+        self.counters = {'hits': 0, 'misses': 0, 'ambiguous': 0}
+        self.lock = threading.Lock()
+
+        for intent, details in schema.items():
+            slot_matchers = {name: SlotMatcher(name, slot) for name, slot in details.get("slots", {}).items()}
+            for template in details.get("templates", []):
+                if self._add_template(intent, template, slot_matchers):
+                    self.templates += 1
+                else:
+                    self.skipped.append((intent, template))
+
+    def _add_template(self, intent, template, slot_matchers):
+        # Literal text is normalized the same way commands are ("ap one" -> "ap 1")
+        parts = []
+        for index, chunk in enumerate(PLACEHOLDER_PATTERN.split(template)):
+            if index % 2:
+                matcher = slot_matchers.get(chunk)
+                if matcher is None or not matcher.supported:
+                    return False
+                parts.append(matcher)
+            else:
+                parts.extend(tokenize(normalize_aviation_input(chunk)))
+
+        node = self.root
+        for part in parts:
+            if isinstance(part, SlotMatcher):
+                # Keyed by matcher, not slot name: "state" accepts different words per intent
+                node = node.slots.setdefault(part, TemplateNode())
+            else:
+                node = node.literals.setdefault(part, TemplateNode())
+        node.intents.add(intent)
+        return True
+
+    def _walk(self, node, tokens, position, end, slots, readings):
+        if position == end:
+            for intent in node.intents:
+                readings.add((intent, tuple(sorted(slots.items()))))
+            return
+
+        child = node.literals.get(tokens[position])
+        if child is not None:
+            self._walk(child, tokens, position + 1, end, slots, readings)
+
+        for matcher, child in node.slots.items():
+            for value, used in matcher.match(tokens[:end], position):
+                self._walk(child, tokens, position + used, end, {**slots, matcher.name: value}, readings)
+
+    def readings(self, text_normalized):
+        tokens = tokenize(text_normalized)
+        readings = set()
+        for prefix in self.prefixes:
+            if tuple(tokens[:len(prefix)]) != prefix:
+                continue
+            for suffix in self.suffixes:
+                end = len(tokens) - len(suffix)
+                if end <= len(prefix) or (suffix and tuple(tokens[end:]) != suffix):
+                    continue
+                self._walk(self.root, tokens, len(prefix), end, {}, readings)
+        return readings
+
+    def match(self, text, text_normalized=None):
+        if text_normalized is None:
+            text_normalized = normalize_aviation_input(text)
+
+        readings = self.readings(text_normalized)
+        with self.lock:
+            if len(readings) != 1:
+                self.counters['ambiguous' if readings else 'misses'] += 1
+                return None
+            self.counters['hits'] += 1
+
+        intent, slots = readings.pop()
+        return {
+            'intent': intent,
+            'slots': postprocess_slots(dict(slots), text_normalized, intent),
+            'confidence': 1.0,
+            'original_text': text,
+            'normalized_text': text_normalized,
+            'source': 'template'
+        }
+
+    def stats(self):
+        with self.lock:
+            counters = dict(self.counters)
+        lookups = sum(counters.values())
+        return {
+            **counters,
+            'templates': self.templates,
+            'hit_rate': counters['hits'] / lookups if lookups else 0.0
+        }
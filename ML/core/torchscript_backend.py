@@ -0,0 +1,55 @@
+import os
+
+import torch
+
+from core.onnx_backend import _ExportWrapper
+from core.quantization import SOURCE_WEIGHT_FILES
+from utils import is_artifact_fresh
+
+
+TORCHSCRIPT_FILENAME = "model.torchscript.pt"
+
+
+def export_torchscript(model, tokenizer, output_path):
+    model = model.to("cpu").eval()
+    example = tokenizer(["set com 1 to 121.5", "gear up"], padding='longest', return_tensors='pt')
+
+    with torch.no_grad():
+        traced = torch.jit.trace(
+            _ExportWrapper(model),
+            (example['input_ids'], example['attention_mask']),
+            strict=False
+        )
+    # Freezing inlines the weights as constants so the graph can be folded and fused
+    traced = torch.jit.freeze(traced.eval())
+
+    tmp_path = output_path + ".tmp"
+    torch.jit.save(traced, tmp_path)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def torchscript_is_fresh(model_path):
+    return is_artifact_fresh(model_path, TORCHSCRIPT_FILENAME, SOURCE_WEIGHT_FILES)
+
+
+class TorchScriptJointModel:
+    """Traced stand-in for JointIntentAndSlotModel at inference time.
+    Called like the torch model and returns (loss, intent_logits, slot_logits),
+    so predict/predict_batch work unchanged."""
+
+    def __init__(self, torchscript_path, device):
+        self.torchscript_path = torchscript_path
+        self.module = torch.jit.load(torchscript_path, map_location=device)
+        self.module.eval()
+
+    def __call__(self, input_ids, attention_mask):
+        intent_logits, slot_logits = self.module(input_ids, attention_mask)
+        return 0, intent_logits, slot_logits
+
+    def eval(self):
+        return self
+
+    def to(self, device):
+        self.module = self.module.to(device)
+        return self
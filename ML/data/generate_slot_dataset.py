@@ -2,11 +2,7 @@ import os
 import json
 import random
 from utils import get_next_version_path
-from schema_config import SCHEMA
-
-#PHRASE VARIATIONS (PREFIXES AND SUFFIXES)
-PREFIXES = ["", "please", "could you", "request", "confirm", "go ahead and"]
-SUFFIXES = ["", "now", "immediately", "for me", "if you would"]
+from schema_config import SCHEMA, PREFIXES, SUFFIXES
 
 #GENERATION LOGIC
 def generate_dataset(schema, num_examples_per_intent=1000):
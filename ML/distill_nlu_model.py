@@ -0,0 +1,262 @@
+import os
+import sys
+import json
+import argparse
+
+import torch
+import torch.nn.functional as F
+from torch.utils.data import DataLoader, TensorDataset
+from transformers import DistilBertConfig
+from torch.optim import AdamW
+from sklearn.model_selection import train_test_split
+from tqdm import tqdm
+
+from core import normalize_dataset, JointIntentAndSlotModel
+from core.model_loader import ModelLoader
+from train_nlu_model import AviationCommandDataset
+from utils import find_latest_version_path, get_model_versions_dir, get_latest_model_path, ModelRegistry
+
+
+STUDENT_MODEL_NAME = "vimaan_nlu_model_student"
+CACHE_DIR_NAME = "distillation_cache"
+
+
+#STUDENT ARCHITECTURE
+def build_student(teacher, num_intents, num_slots, n_layers, dim, n_heads):
+    teacher_config = teacher.bert_for_slots.config
+    config = DistilBertConfig(
+        vocab_size=teacher_config.vocab_size,
+        max_position_embeddings=teacher_config.max_position_embeddings,
+        n_layers=n_layers,
+        dim=dim,
+        n_heads=n_heads,
+        hidden_dim=dim * 4
+    )
+    student = JointIntentAndSlotModel(num_intents, num_slots, config=config)
+
+    # Start from the teacher's embedding space squeezed to the student width (PCA),
+    # which converges far faster than random embeddings on a dataset this small
+    teacher_embeddings = teacher.bert_for_slots.distilbert.embeddings
+    student_embeddings = student.bert_for_slots.distilbert.embeddings
+    with torch.no_grad():
+        for name in ("word_embeddings", "position_embeddings"):
+            weight = getattr(teacher_embeddings, name).weight.float().cpu()
+            if weight.shape[1] >= dim:
+                centered = weight - weight.mean(dim=0)
+                _, _, components = torch.pca_lowrank(centered, q=dim, center=False)
+                projected = centered @ components[:, :dim]
+                projected *= getattr(student_embeddings, name).weight.std() / projected.std()
+                getattr(student_embeddings, name).weight.copy_(projected)
+    return student
+
+
+#TEACHER LOGIT CACHE
+def encode_dataset(dataset):
+    items = [dataset[i] for i in range(len(dataset))]
+    return TensorDataset(
+        torch.stack([item['input_ids'] for item in items]),
+        torch.stack([item['attention_mask'] for item in items]),
+        torch.stack([item['intent_label'] for item in items]),
+        torch.stack([item['slot_labels'] for item in items])
+    )
+
+
+def teacher_logits(teacher, encoded, device, cache_path, batch_size=128):
+    if os.path.exists(cache_path):
+        print(f"Using cached teacher logits from {cache_path}")
+        return torch.load(cache_path)
+
+    teacher.eval()
+    intent_logits, slot_logits = [], []
+    loader = DataLoader(encoded, batch_size=batch_size)
+    with torch.no_grad():
+        for input_ids, attention_mask, _, _ in tqdm(loader, desc="Teacher logits"):
+            _, intents, slots = teacher(input_ids.to(device), attention_mask.to(device))
+            intent_logits.append(intents.cpu().half())
+            slot_logits.append(slots.cpu().half())
+
+    cached = {'intent_logits': torch.cat(intent_logits), 'slot_logits': torch.cat(slot_logits)}
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    torch.save(cached, cache_path)
+    print(f"Cached teacher logits to {cache_path}")
+    return cached
+
+
+#DISTILLATION LOSS
+def distillation_loss(student_intents, student_slots, teacher_intents, teacher_slots,
+                      intent_labels, slot_labels, attention_mask, temperature, alpha):
+    t = temperature
+    soft_intent = F.kl_div(
+        F.log_softmax(student_intents / t, dim=-1), F.softmax(teacher_intents / t, dim=-1), reduction='batchmean'
+    ) * t * t
+
+    token_mask = attention_mask.bool()
+    soft_slot = F.kl_div(
+        F.log_softmax(student_slots[token_mask] / t, dim=-1),
+        F.softmax(teacher_slots[token_mask] / t, dim=-1),
+        reduction='batchmean'
+    ) * t * t
+
+    hard_intent = F.cross_entropy(student_intents, intent_labels)
+    hard_slot = F.cross_entropy(student_slots.reshape(-1, student_slots.shape[-1]), slot_labels.reshape(-1))
+    return alpha * (soft_intent + soft_slot) + (1 - alpha) * (hard_intent + hard_slot)
+
+
+def evaluate(model, loader, device):
+    model.eval()
+    intent_correct, slot_correct, slot_total, total = 0, 0, 0, 0
+    with torch.no_grad():
+        for input_ids, attention_mask, intent_labels, slot_labels in loader:
+            _, intents, slots = model(input_ids.to(device), attention_mask.to(device))
+            intent_correct += (intents.argmax(dim=-1).cpu() == intent_labels).sum().item()
+            labelled = slot_labels != -100
+            slot_correct += (slots.argmax(dim=-1).cpu()[labelled] == slot_labels[labelled]).sum().item()
+            slot_total += labelled.sum().item()
+            total += len(intent_labels)
+    return intent_correct / total, slot_correct / max(slot_total, 1)
+
+
+#THE DISTILLATION PROCESS
+def distill_model(dataset_path, teacher_path, args):
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+    print(f"Loading teacher from {teacher_path}...")
+    teacher_loader = ModelLoader(device, use_torchscript=False)
+    teacher_loader.load_all(teacher_path)
+    teacher, tokenizer = teacher_loader.model, teacher_loader.tokenizer
+    intent_map, slot_map = teacher_loader.intent_map, teacher_loader.slot_map
+
+    print("Loading final dataset...")
+    with open(dataset_path, "r") as f:
+        data = [json.loads(line) for line in f]
+    data = normalize_dataset(data)
+    if args.max_examples:
+        data = data[:args.max_examples]
+    # Same split as train_nlu_model.py, so on the full dataset the teacher never saw the validation rows
+    train_data, val_data = train_test_split(data, test_size=0.15, random_state=42)
+
+    train_encoded = encode_dataset(AviationCommandDataset(train_data, tokenizer, intent_map, slot_map))
+    val_encoded = encode_dataset(AviationCommandDataset(val_data, tokenizer, intent_map, slot_map))
+
+    cache_name = f"{os.path.basename(teacher_path)}_{os.path.splitext(os.path.basename(dataset_path))[0]}_{len(data)}.pt"
+    cache_path = os.path.join(get_model_versions_dir(model_name=CACHE_DIR_NAME), cache_name)
+    cached = teacher_logits(teacher, train_encoded, device, cache_path)
+
+    train_set = TensorDataset(*train_encoded.tensors, cached['intent_logits'], cached['slot_logits'])
+    train_loader = DataLoader(train_set, batch_size=args.batch_size, shuffle=True)
+    val_loader = DataLoader(val_encoded, batch_size=128)
+
+    teacher_intent_acc, teacher_slot_acc = evaluate(teacher, val_loader, device)
+    print(f"Teacher validation: intent {teacher_intent_acc:.4f}, slot tokens {teacher_slot_acc:.4f}")
+
+    student = build_student(
+        teacher, len(intent_map), len(slot_map), args.layers, args.dim, args.heads
+    ).to(device)
+    del teacher, teacher_loader
+    print(f"Student: {args.layers} layers, dim {args.dim}, "
+          f"{sum(p.numel() for p in student.parameters()) / 1e6:.1f}M parameters")
+
+    optimizer = AdamW(student.parameters(), lr=args.lr)
+    registry = ModelRegistry(get_model_versions_dir(model_name=STUDENT_MODEL_NAME))
+    registry.initialize()
+    model_save_path = registry.next_version_path()
+
+    best_val_intent_acc = -1.0
+    best_metrics = None
+    epochs_no_improve = 0
+    patience = 3
+
+    print("\nStarting distillation...")
+    for epoch in range(args.epochs):
+        student.train()
+        total_loss = 0
+        for input_ids, attention_mask, intent_labels, slot_labels, t_intents, t_slots in tqdm(
+                train_loader, desc=f"Epoch {epoch+1} [Distillation]"):
+            optimizer.zero_grad()
+            attention_mask = attention_mask.to(device)
+            _, s_intents, s_slots = student(input_ids.to(device), attention_mask)
+
+            loss = distillation_loss(
+                s_intents, s_slots, t_intents.to(device).float(), t_slots.to(device).float(),
+                intent_labels.to(device), slot_labels.to(device), attention_mask,
+                args.temperature, args.alpha
+            )
+            total_loss += loss.item()
+            loss.backward()
+            optimizer.step()
+
+        val_intent_acc, val_slot_acc = evaluate(student, val_loader, device)
+        print(f"Epoch {epoch+1} - Loss: {total_loss / len(train_loader):.4f}, "
+              f"validation intent {val_intent_acc:.4f}, slot tokens {val_slot_acc:.4f}")
+
+        if val_intent_acc > best_val_intent_acc:
+            best_val_intent_acc = val_intent_acc
+            best_metrics = {'intent_acc': val_intent_acc, 'slot_token_acc': val_slot_acc, 'epoch': epoch + 1}
+            epochs_no_improve = 0
+
+            print(f"Validation accuracy improved! Saving student to {model_save_path}")
+            os.makedirs(model_save_path, exist_ok=True)
+            tokenizer.save_pretrained(model_save_path)
+            student.bert_for_slots.save_pretrained(model_save_path)
+            torch.save(student.intent_classifier.state_dict(), f"{model_save_path}/intent_classifier.bin")
+            with open(f"{model_save_path}/intent_map.json", "w") as f: json.dump(intent_map, f)
+            with open(f"{model_save_path}/slot_map.json", "w") as f: json.dump(slot_map, f)
+            with open(f"{model_save_path}/distillation.json", "w") as f:
+                json.dump({
+                    'teacher': teacher_path,
+                    'dataset': os.path.basename(dataset_path),
+                    'epoch': epoch + 1,
+                    'student': {'layers': args.layers, 'dim': args.dim, 'heads': args.heads},
+                    'temperature': args.temperature,
+                    'alpha': args.alpha,
+                    'validation': {'intent_acc': val_intent_acc, 'slot_token_acc': val_slot_acc},
+                    'teacher_validation': {'intent_acc': teacher_intent_acc, 'slot_token_acc': teacher_slot_acc}
+                }, f, indent=2)
+        else:
+            epochs_no_improve += 1
+            print(f"Validation accuracy did not improve. Count: {epochs_no_improve}/{patience}")
+            if epochs_no_improve >= patience:
+                print(f"Early stopping triggered after {epoch+1} epochs.")
+                break
+
+    # Registered only once the best checkpoint is final
+    promote = registry.is_better(best_metrics, 'intent_acc')
+    version = registry.register(model_save_path, metrics=best_metrics, promote=promote, teacher=teacher_path)
+    print(f"\nStudent saved to {model_save_path} and registered as {version}{' (promoted)' if promote else ''}")
+    print(f"Compare it with the teacher: python benchmarks/benchmark_student.py {teacher_path} {model_save_path}")
+    return model_save_path
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Distill the best vN model into a small student")
+    parser.add_argument("--teacher", default=None, help="teacher vN directory (default: latest)")
+    parser.add_argument("--layers", type=int, default=2)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--heads", type=int, default=4)
+    parser.add_argument("--epochs", type=int, default=15)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--lr", type=float, default=3e-4)
+    parser.add_argument("--temperature", type=float, default=2.0)
+    parser.add_argument("--alpha", type=float, default=0.7, help="weight of the teacher (soft) loss")
+    parser.add_argument("--max-examples", type=int, default=None, help="cap the dataset for quick experiments")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    script_dir = os.path.dirname(__file__)
+    DATA_DIR = os.path.join(script_dir, "datasets", "05_final_merged")
+    BASE_FILENAME = os.path.join(DATA_DIR, "aviation_cmds_final_training_set.jsonl")
+
+    teacher_path = args.teacher or get_latest_model_path()
+    latest_dataset = find_latest_version_path(BASE_FILENAME)
+
+    if not teacher_path:
+        print("Error: no trained teacher model found, run train_nlu_model.py first.")
+        sys.exit(1)
+    if latest_dataset and os.path.exists(latest_dataset):
+        print(f"Found dataset: {os.path.basename(latest_dataset)}")
+        distill_model(latest_dataset, teacher_path, args)
+    else:
+        print(f"Error: Dataset not found in '{DATA_DIR}'.")
+        sys.exit(1)
@@ -0,0 +1,25 @@
+import os
+import sys
+import torch
+
+ml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".")
+sys.path.insert(0, ml_path)
+
+from core.model_loader import ModelLoader
+from core.bundle import export_bundle, BUNDLE_FILENAME
+
+
+if __name__ == "__main__":
+    model_path = sys.argv[1] if len(sys.argv) > 1 else None
+    
+    print("Loading model...")
+    loader = ModelLoader(torch.device("cpu"), use_torchscript=False, use_bundle=False)
+    results = loader.load_all(model_path)
+    model_path = results['model']['model_path']
+    print(f"Model loaded from: {model_path}")
+    
+    output_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(model_path, BUNDLE_FILENAME)
+    print(f"Packing model bundle to {output_path}...")
+    export_bundle(loader.model, loader.tokenizer, loader.intent_map, loader.slot_map, output_path, model_path)
+    print(f"Done ({os.path.getsize(output_path) / 1e6:.1f} MB). ModelLoader maps it automatically, "
+          f"or pass the file itself to load_all().")
@@ -0,0 +1,25 @@
+import os
+import sys
+import torch
+
+ml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".")
+sys.path.insert(0, ml_path)
+
+from core.model_loader import ModelLoader
+from core.onnx_backend import export_onnx, ONNX_FILENAME
+
+
+if __name__ == "__main__":
+    model_path = sys.argv[1] if len(sys.argv) > 1 else None
+    
+    print("Loading model...")
+    # The eager model: a traced TorchScript module cannot be re-exported with dynamic axes
+    loader = ModelLoader(torch.device("cpu"), use_torchscript=False, use_bundle=False)
+    results = loader.load_all(model_path)
+    model_path = results['model']['model_path']
+    print(f"Model loaded from: {model_path}")
+    
+    output_path = os.path.join(model_path, ONNX_FILENAME)
+    print(f"Exporting ONNX graph to {output_path}...")
+    export_onnx(loader.model, loader.tokenizer, output_path)
+    print(f"Done ({os.path.getsize(output_path) / 1e6:.1f} MB). Load it with ModelLoader(backend='onnx').")
@@ -0,0 +1,24 @@
+import os
+import sys
+import torch
+
+ml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".")
+sys.path.insert(0, ml_path)
+
+from core.model_loader import ModelLoader
+from core.torchscript_backend import export_torchscript, TORCHSCRIPT_FILENAME
+
+
+if __name__ == "__main__":
+    model_path = sys.argv[1] if len(sys.argv) > 1 else None
+    
+    print("Loading model...")
+    loader = ModelLoader(torch.device("cpu"), use_torchscript=False)
+    results = loader.load_all(model_path)
+    model_path = results['model']['model_path']
+    print(f"Model loaded from: {model_path}")
+    
+    output_path = os.path.join(model_path, TORCHSCRIPT_FILENAME)
+    print(f"Tracing TorchScript module to {output_path}...")
+    export_torchscript(loader.model, loader.tokenizer, output_path)
+    print(f"Done ({os.path.getsize(output_path) / 1e6:.1f} MB). ModelLoader picks it up automatically.")
@@ -0,0 +1,60 @@
+import os
+import sys
+import json
+import argparse
+
+ml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".")
+sys.path.insert(0, ml_path)
+
+from utils import ModelRegistry, get_model_versions_dir
+
+
+def list_versions(registry):
+    manifest = registry.read()
+    if manifest is None:
+        print(f"No {os.path.basename(registry.path)} in {registry.models_dir} yet, run: python manage_models.py bootstrap")
+        return
+    for version, entry in sorted(manifest['versions'].items(), key=lambda item: int(item[0][1:])):
+        marker = "*" if version == manifest['promoted'] else " "
+        print(f"{marker} {version:<5} {entry['created_at']}  {entry['size_bytes'] / 1e6:8.1f} MB  "
+              f"{entry['sha256'][:12]}  {json.dumps(entry['metrics'])}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Inspect and update the model registry (registry.json)")
+    parser.add_argument("--model-name", default="vimaan_nlu_model_best",
+                        help="model family directory under models/, e.g. vimaan_nlu_model_student")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="registered versions, * marks the promoted one")
+    commands.add_parser("bootstrap", help="register the complete vN directories already on disk")
+    register = commands.add_parser("register", help="register a finished vN directory")
+    register.add_argument("version")
+    register.add_argument("--promote", action="store_true")
+    promote = commands.add_parser("promote", help="make a registered version the one ModelLoader loads")
+    promote.add_argument("version")
+    verify = commands.add_parser("verify", help="re-hash versions and compare with the registry")
+    verify.add_argument("version", nargs="?")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    registry = ModelRegistry(get_model_versions_dir(model_name=args.model_name))
+
+    if args.command == "list":
+        list_versions(registry)
+    elif args.command == "bootstrap":
+        registered = registry.bootstrap()
+        print(f"Registered {', '.join(registered) or 'nothing new'}; promoted: {registry.promoted()}")
+    elif args.command == "register":
+        version = registry.register(registry.version_path(args.version), promote=args.promote)
+        print(f"Registered {version}{' and promoted it' if args.promote else ''}")
+    elif args.command == "promote":
+        registry.promote(args.version)
+        print(f"Promoted {args.version}")
+    elif args.command == "verify":
+        versions = [args.version] if args.version else sorted(registry.versions(), key=lambda v: int(v[1:]))
+        failed = [version for version in versions if not registry.verify(version)]
+        for version in versions:
+            print(f"{version}: {'MODIFIED' if version in failed else 'ok'}")
+        sys.exit(1 if failed else 0)
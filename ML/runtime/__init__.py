@@ -0,0 +1,49 @@
+from .audio_capture import AudioCapture
+from .noise_floor import NoiseFloorEstimator, chunk_energy
+from .command_worker import CommandWorker
+from .event_log import AsyncEventLog
+from .speculation import SpeculativeInterpreter
+from .model_service import ModelService, ModelNotReadyError, WARMUP_COMMANDS
+from .prediction_cache import PredictionCache
+from .registry_watcher import RegistryWatcher
+from .handle_registry import HandleRegistry
+from .dispatch import (
+    compile_actions,
+    action_paths,
+    CommandAction,
+    DatarefAction
+)
+from .asr_backends import (
+    ASRBackend,
+    GoogleASRBackend,
+    VoskASRBackend,
+    FileASRBackend,
+    ASR_BACKENDS,
+    create_asr_backend
+)
+
+__all__ = [
+    'AudioCapture',
+    'NoiseFloorEstimator',
+    'chunk_energy',
+    'CommandWorker',
+    'AsyncEventLog',
+    'SpeculativeInterpreter',
+    'ModelService',
+    'ModelNotReadyError',
+    'WARMUP_COMMANDS',
+    'PredictionCache',
+    'RegistryWatcher',
+    'HandleRegistry',
+    'compile_actions',
+    'action_paths',
+    'CommandAction',
+    'DatarefAction',
+
+    'ASRBackend',
+    'GoogleASRBackend',
+    'VoskASRBackend',
+    'FileASRBackend',
+    'ASR_BACKENDS',
+    'create_asr_backend'
+]
@@ -0,0 +1,192 @@
+import os
+import json
+import time
+
+import speech_recognition as sr
+
+
+class ASRBackend:
+    """Common interface for speech-to-text engines. Backends raise
+    sr.UnknownValueError / sr.RequestError like speech_recognition does,
+    and every call is timed so engines can be compared on latency.
+
+    Streaming backends also implement start_stream/feed_stream/finish_stream:
+    feed_stream returns the current partial hypothesis (or None) and
+    finish_stream returns the same dict as transcribe."""
+
+    name = "base"
+    supports_streaming = False
+
+    def __init__(self):
+        self.calls = 0
+        self.total_latency_ms = 0.0
+        self.last_latency_ms = None
+
+    def transcribe(self, audio):
+        return self._timed(self._transcribe, audio)
+
+    def finish_stream(self):
+        return self._timed(self._finish_stream)
+
+    def _timed(self, recognize, *args):
+        start = time.perf_counter()
+        try:
+            text = recognize(*args)
+        finally:
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.calls += 1
+            self.total_latency_ms += latency_ms
+            self.last_latency_ms = latency_ms
+
+        text = (text or "").strip()
+        if not text:
+            raise sr.UnknownValueError()
+
+        return {
+            'text': text,
+            'latency_ms': latency_ms,
+            'backend': self.name
+        }
+
+    def _transcribe(self, audio):
+        raise NotImplementedError
+
+    def start_stream(self):
+        raise NotImplementedError(f"ASR backend '{self.name}' does not support streaming")
+
+    def feed_stream(self, chunk, sample_rate, sample_width):
+        raise NotImplementedError(f"ASR backend '{self.name}' does not support streaming")
+
+    def _finish_stream(self):
+        raise NotImplementedError(f"ASR backend '{self.name}' does not support streaming")
+
+    def stats(self):
+        return {
+            'backend': self.name,
+            'calls': self.calls,
+            'last_latency_ms': self.last_latency_ms,
+            'mean_latency_ms': self.total_latency_ms / self.calls if self.calls else None
+        }
+
+
+class GoogleASRBackend(ASRBackend):
+    name = "google"
+
+    def __init__(self, recognizer=None, language="en-US"):
+        super().__init__()
+        self.recognizer = recognizer or sr.Recognizer()
+        self.language = language
+
+    def _transcribe(self, audio):
+        return self.recognizer.recognize_google(audio, language=self.language)
+
+
+class VoskASRBackend(ASRBackend):
+    """Fully offline CPU recognizer. Needs the `vosk` package and an
+    unpacked model directory (e.g. vosk-model-small-en-us)."""
+
+    name = "vosk"
+    supports_streaming = True
+    SAMPLE_RATE = 16000
+
+    def __init__(self, model_path, phrases=None):
+        super().__init__()
+        if not model_path or not os.path.isdir(model_path):
+            raise FileNotFoundError(f"Vosk model not found at {model_path}")
+
+        import vosk
+        vosk.SetLogLevel(-1)
+
+        self.vosk = vosk
+        self.model = vosk.Model(model_path)
+        # An optional phrase list restricts decoding to the command vocabulary
+        self.grammar = json.dumps(list(phrases) + ["[unk]"]) if phrases else None
+        self.stream = None
+        self.stream_segments = []
+
+    def _new_recognizer(self):
+        if self.grammar:
+            return self.vosk.KaldiRecognizer(self.model, self.SAMPLE_RATE, self.grammar)
+        return self.vosk.KaldiRecognizer(self.model, self.SAMPLE_RATE)
+
+    def _transcribe(self, audio):
+        recognizer = self._new_recognizer()
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=self.SAMPLE_RATE, convert_width=2))
+        text = json.loads(recognizer.FinalResult()).get('text', '')
+        return text.replace("[unk]", "")
+
+    def start_stream(self):
+        self.stream = self._new_recognizer()
+        self.stream_segments = []
+
+    def feed_stream(self, chunk, sample_rate, sample_width):
+        data = sr.AudioData(chunk, sample_rate, sample_width).get_raw_data(
+            convert_rate=self.SAMPLE_RATE, convert_width=2
+        )
+        if self.stream.AcceptWaveform(data):
+            # Vosk hit an endpoint: the segment is final, keep it and start a new partial
+            self.stream_segments.append(json.loads(self.stream.Result()).get('text', ''))
+            partial = ''
+        else:
+            partial = json.loads(self.stream.PartialResult()).get('partial', '')
+        return self._join_segments(partial)
+
+    def _finish_stream(self):
+        final = json.loads(self.stream.FinalResult()).get('text', '')
+        self.stream = None
+        return self._join_segments(final)
+
+    def _join_segments(self, tail):
+        text = " ".join(part for part in self.stream_segments + [tail] if part)
+        return text.replace("[unk]", "").strip() or None
+
+
+class FileASRBackend(ASRBackend):
+    """Deterministic stub for tests: ignores the audio and returns the
+    transcripts from a text file (one per line) in order, cycling. When
+    streaming, each fed chunk reveals one more word of the transcript."""
+
+    name = "file"
+    supports_streaming = True
+
+    def __init__(self, transcripts_path):
+        super().__init__()
+        if not os.path.exists(transcripts_path):
+            raise FileNotFoundError(f"Transcripts file not found at {transcripts_path}")
+
+        with open(transcripts_path, "r", encoding="utf-8") as f:
+            self.transcripts = [line.strip() for line in f if line.strip()]
+        if not self.transcripts:
+            raise ValueError(f"No transcripts in {transcripts_path}")
+        self.position = 0
+        self.stream_words = None
+        self.stream_fed = 0
+
+    def _transcribe(self, audio):
+        text = self.transcripts[self.position % len(self.transcripts)]
+        self.position += 1
+        return text
+
+    def start_stream(self):
+        self.stream_words = self._transcribe(None).split()
+        self.stream_fed = 0
+
+    def feed_stream(self, chunk, sample_rate, sample_width):
+        self.stream_fed = min(self.stream_fed + 1, len(self.stream_words))
+        return " ".join(self.stream_words[:self.stream_fed])
+
+    def _finish_stream(self):
+        return " ".join(self.stream_words)
+
+
+ASR_BACKENDS = {
+    'google': GoogleASRBackend,
+    'vosk': VoskASRBackend,
+    'file': FileASRBackend,
+}
+
+
+def create_asr_backend(name, **kwargs):
+    if name not in ASR_BACKENDS:
+        raise ValueError(f"Unknown ASR backend '{name}', expected one of {sorted(ASR_BACKENDS)}")
+    return ASR_BACKENDS[name](**kwargs)
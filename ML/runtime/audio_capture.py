@@ -0,0 +1,118 @@
+import math
+import threading
+import collections
+
+import speech_recognition as sr
+
+from runtime.noise_floor import chunk_energy
+
+
+class AudioCapture:
+    """Keeps the microphone open on a background thread and records
+    push-to-talk utterances into a bounded ring buffer, so the hotkey
+    callbacks only flip state and never block the sim thread on audio.
+    An optional `listener(chunk, sample_rate, sample_width)` also receives
+    every recorded chunk as it arrives, for streaming recognition.
+
+    With a `noise_floor` estimator, idle audio keeps the energy threshold
+    calibrated in the background and recorded utterances are trimmed of
+    leading/trailing silence below it before they are handed on."""
+
+    def __init__(self, microphone, max_seconds=15.0, listener=None, noise_floor=None, silence_padding=0.25, log=print):
+        self.microphone = microphone
+        self.max_seconds = max_seconds
+        self.listener = listener
+        self.noise_floor = noise_floor
+        self.silence_padding = silence_padding
+        self.log = log
+
+        self.sample_rate = None
+        self.sample_width = None
+        self.seconds_per_chunk = None
+        self.frames = None
+        self.dropped_chunks = 0
+
+        self.lock = threading.Lock()
+        self.ready = threading.Event()
+        self.recording = threading.Event()
+        self.running = threading.Event()
+        self.thread = None
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.running.set()
+        self.thread = threading.Thread(target=self._capture_loop, name="VimaanAudioCapture", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=2.0):
+        self.running.clear()
+        self.recording.clear()
+        if self.thread:
+            self.thread.join(timeout=timeout)
+            self.thread = None
+
+    def begin(self):
+        if not self.ready.is_set():
+            return False
+        with self.lock:
+            self.frames.clear()
+            self.dropped_chunks = 0
+        self.recording.set()
+        return True
+
+    def end(self):
+        if not self.recording.is_set():
+            return None
+        self.recording.clear()
+
+        with self.lock:
+            frames = list(self.frames)
+            dropped = self.dropped_chunks
+            self.frames.clear()
+
+        if dropped:
+            self.log(f"[Vimaan] Capture buffer full, dropped {dropped} oldest audio chunks")
+        if not frames:
+            return None
+        if self.noise_floor:
+            frames = self._trim_silence(frames, self.noise_floor.threshold)
+        return sr.AudioData(b"".join(frames), self.sample_rate, self.sample_width)
+
+    def _trim_silence(self, frames, threshold):
+        voiced = [i for i, chunk in enumerate(frames) if chunk_energy(chunk, self.sample_width) > threshold]
+        if not voiced:
+            # Nothing cleared the threshold; let the recognizer decide rather than drop the utterance
+            return frames
+
+        padding = math.ceil(self.silence_padding / self.seconds_per_chunk)
+        return frames[max(0, voiced[0] - padding):voiced[-1] + padding + 1]
+
+    def _capture_loop(self):
+        try:
+            with self.microphone as source:
+                self.sample_rate = source.SAMPLE_RATE
+                self.sample_width = source.SAMPLE_WIDTH
+                self.seconds_per_chunk = source.CHUNK / source.SAMPLE_RATE
+                max_chunks = math.ceil(self.max_seconds * source.SAMPLE_RATE / source.CHUNK)
+                self.frames = collections.deque(maxlen=max_chunks)
+                self.ready.set()
+                self.log(f"[Vimaan] Audio capture ready ({source.SAMPLE_RATE} Hz, buffer {self.max_seconds:.0f}s)")
+
+                while self.running.is_set():
+                    chunk = source.stream.read(source.CHUNK)
+                    if not self.recording.is_set():
+                        if self.noise_floor:
+                            self.noise_floor.update(chunk, self.sample_width, self.seconds_per_chunk)
+                        continue
+                    with self.lock:
+                        if len(self.frames) == self.frames.maxlen:
+                            self.dropped_chunks += 1
+                        self.frames.append(chunk)
+                    if self.listener:
+                        self.listener(chunk, self.sample_rate, self.sample_width)
+        except Exception as e:
+            self.log(f"[Vimaan] Audio capture error: {str(e)}")
+        finally:
+            self.ready.clear()
+            self.recording.clear()
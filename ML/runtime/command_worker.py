@@ -0,0 +1,90 @@
+import time
+import queue
+import threading
+import traceback
+
+import speech_recognition as sr
+
+from runtime.model_service import ModelNotReadyError
+
+
+class CommandWorker:
+    """Runs speech recognition and NLU for captured utterances on a
+    background thread. Finished results are queued for the sim thread to
+    drain from a flight loop, where the dataref/command writes happen.
+
+    A job is whatever the caller submits; it is handed to recognize(job)
+    and then to interpret(text, job)."""
+
+    def __init__(self, recognize, interpret, max_pending=4, log=print):
+        self.recognize = recognize
+        self.interpret = interpret
+        self.log = log
+
+        self.jobs = queue.Queue(maxsize=max_pending)
+        self.results = queue.Queue()
+        self.thread = None
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.thread = threading.Thread(target=self._run, name="VimaanCommandWorker", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=2.0):
+        if not self.thread:
+            return
+        try:
+            self.jobs.put_nowait(None)
+        except queue.Full:
+            pass
+        self.thread.join(timeout=timeout)
+        self.thread = None
+
+    def submit(self, job):
+        try:
+            self.jobs.put_nowait(job)
+            return True
+        except queue.Full:
+            return False
+
+    def drain(self, max_items=8):
+        drained = []
+        while len(drained) < max_items:
+            try:
+                drained.append(self.results.get_nowait())
+            except queue.Empty:
+                break
+        return drained
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            self.results.put(self._process(job))
+
+    def _process(self, job):
+        result = {
+            'job': job,
+            'status': 'ok',
+            'text': None,
+            'prediction': None,
+            'error': None
+        }
+        try:
+            result['text'] = self.recognize(job)
+            result['prediction'] = self.interpret(result['text'], job)
+        except sr.UnknownValueError:
+            result['status'] = 'not_understood'
+        except sr.RequestError as e:
+            result['status'] = 'asr_error'
+            result['error'] = str(e)
+        except ModelNotReadyError as e:
+            result['status'] = 'not_ready'
+            result['error'] = str(e)
+        except Exception as e:
+            result['status'] = 'error'
+            result['error'] = f"{str(e)}\n{traceback.format_exc()}"
+        result['finished_at'] = time.perf_counter()
+        return result
@@ -0,0 +1,170 @@
+def action_paths(actions):
+    dataref_paths = []
+    command_paths = []
+
+    for intent, spec in actions.items():
+        if spec.get('type') == 'dataref':
+            datarefs = spec['dataref']
+            for path in (datarefs.values() if isinstance(datarefs, dict) else [datarefs]):
+                if path not in dataref_paths:
+                    dataref_paths.append(path)
+        elif spec.get('type') == 'command':
+            for path, _ in spec['commands'].values():
+                if path not in command_paths:
+                    command_paths.append(path)
+
+    return dataref_paths, command_paths
+
+
+def make_converter(scale, valid_range):
+    low, high = valid_range
+
+    def convert(raw_value):
+        value = float(raw_value)
+        if not low <= value <= high:
+            raise ValueError(f"{raw_value} outside valid range {low}-{high}")
+        return value * scale
+
+    return convert
+
+
+DEFAULT_INVALID_STATE_SPEECH = "Unknown {slot} {state}"
+
+
+class CommandAction:
+
+    def __init__(self, intent, slot, default, targets, run_command, fallback=None, invalid_speech=None):
+        self.intent = intent
+        self.slot = slot
+        self.default = default
+        self.targets = targets
+        self.run_command = run_command
+        self.fallback = fallback
+        self.invalid_speech = invalid_speech or DEFAULT_INVALID_STATE_SPEECH
+
+    def execute(self, slots):
+        state = slots.get(self.slot) or self.default
+        target = self.targets.get(state)
+        detail = f"{self.slot}={state}"
+        if target is None and self.fallback is not None:
+            target = self.targets[self.fallback]
+            detail = f"{self.slot}={state}, fell back to {self.fallback}"
+        if target is None:
+            speech = self.invalid_speech.format(slot=self.slot, state=state)
+            return {'executed': False, 'speech': speech, 'detail': f"no command for {self.slot}={state}"}
+
+        handle, speech = target
+        self.run_command(handle)
+        return {'executed': True, 'speech': speech, 'detail': detail}
+
+
+class DatarefAction:
+
+    def __init__(self, intent, slot, selector, default_selector, targets, convert, speech, invalid_speech, set_value):
+        self.intent = intent
+        self.slot = slot
+        self.selector = selector
+        self.default_selector = default_selector
+        self.targets = targets
+        self.convert = convert
+        self.speech = speech
+        self.invalid_speech = invalid_speech
+        self.set_value = set_value
+
+    def execute(self, slots):
+        raw_value = slots.get(self.slot)
+        if not raw_value:
+            return {'executed': False, 'speech': None, 'detail': f"missing slot {self.slot}"}
+
+        selected = (slots.get(self.selector) or self.default_selector) if self.selector else None
+        handle = self.targets.get(selected)
+        if handle is None:
+            return {'executed': False, 'speech': self.invalid_speech, 'detail': f"no dataref for {self.selector}={selected}"}
+
+        try:
+            value = self.convert(raw_value)
+        except ValueError as e:
+            return {'executed': False, 'speech': self.invalid_speech, 'detail': str(e)}
+
+        self.set_value(handle, value)
+        speech = self.speech.format(value=raw_value, selector=selected)
+        return {'executed': True, 'speech': speech, 'detail': f"{self.slot}={value}"}
+
+
+REQUIRED_KEYS = {
+    'command': ('slot', 'commands'),
+    'dataref': ('slot', 'dataref', 'range', 'speech'),
+}
+
+
+def validate_action(intent, spec):
+    action_type = spec.get('type')
+    if action_type not in REQUIRED_KEYS:
+        raise ValueError(f"Unknown action type '{action_type}' for intent '{intent}'")
+
+    for key in REQUIRED_KEYS[action_type]:
+        if key not in spec:
+            raise ValueError(f"Action spec for intent '{intent}' is missing '{key}'")
+
+    if action_type == 'command' and spec.get('fallback') is not None and spec['fallback'] not in spec['commands']:
+        raise ValueError(f"Fallback '{spec['fallback']}' for intent '{intent}' is not one of its commands")
+
+    if action_type == 'dataref':
+        low, high = spec['range']
+        if low > high:
+            raise ValueError(f"Invalid range {spec['range']} for intent '{intent}'")
+        if isinstance(spec['dataref'], dict) and not spec.get('selector'):
+            raise ValueError(f"Intent '{intent}' maps several datarefs but has no selector slot")
+
+
+def compile_actions(actions, handles, xp):
+    """Turns the declarative ACTIONS spec into a flat intent -> action table
+    using already-resolved handles. Malformed specs raise ValueError at load
+    time; intents whose handles did not resolve are returned as skipped."""
+    table = {}
+    skipped = {}
+
+    for intent, spec in actions.items():
+        validate_action(intent, spec)
+
+        if spec['type'] == 'command':
+            targets = {
+                state: (handles.commands.get(path), speech)
+                for state, (path, speech) in spec['commands'].items()
+            }
+            unresolved = [spec['commands'][state][0] for state, (handle, _) in targets.items() if handle is None]
+            if unresolved:
+                skipped[intent] = unresolved
+                continue
+
+            table[intent] = CommandAction(
+                intent,
+                spec['slot'],
+                spec.get('default'),
+                targets,
+                xp.commandOnce,
+                spec.get('fallback'),
+                spec.get('invalid_speech')
+            )
+
+        else:
+            datarefs = spec['dataref'] if isinstance(spec['dataref'], dict) else {None: spec['dataref']}
+            targets = {key: handles.datarefs.get(path) for key, path in datarefs.items()}
+            unresolved = [datarefs[key] for key, handle in targets.items() if handle is None]
+            if unresolved:
+                skipped[intent] = unresolved
+                continue
+
+            table[intent] = DatarefAction(
+                intent,
+                spec['slot'],
+                spec.get('selector'),
+                spec.get('default_selector'),
+                targets,
+                make_converter(spec.get('scale', 1), spec['range']),
+                spec['speech'],
+                spec.get('invalid_speech'),
+                xp.setDataf
+            )
+
+    return table, skipped
@@ -0,0 +1,138 @@
+import os
+import json
+import time
+import queue
+import threading
+
+
+class AsyncEventLog:
+    """Structured JSONL event log written by a background thread. Callers
+    only build a small dict and enqueue it; serialization, batching, disk
+    I/O and size-based rotation all happen off the caller's thread. When the
+    bounded queue is full, events are dropped and counted instead of
+    blocking the simulator. An event that cannot be serialized or written is
+    counted as an error and skipped; the writer thread keeps running."""
+
+    def __init__(self, log_path, max_bytes=5 * 1024 * 1024, backup_count=5,
+                 max_queue=10000, batch_size=256, flush_interval=0.5):
+        self.log_path = log_path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.events = queue.Queue(maxsize=max_queue)
+        self.file = None
+        self.thread = None
+        self.running = threading.Event()
+
+        # emit() runs on many threads and the writer updates the same counters
+        self.stats_lock = threading.Lock()
+        self.stats = {
+            'enqueued': 0,
+            'dropped': 0,
+            'written': 0,
+            'errors': 0,
+            'batches': 0,
+            'rotations': 0,
+            'max_depth': 0
+        }
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.file = open(self.log_path, "a", encoding="utf-8")
+        self.running.set()
+        self.thread = threading.Thread(target=self._run, name="VimaanEventLog", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=2.0):
+        self.running.clear()
+        if self.thread:
+            self.thread.join(timeout=timeout)
+            self.thread = None
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def emit(self, message, level="INFO", **fields):
+        event = {
+            'ts': time.time(),
+            'level': level,
+            'thread': threading.current_thread().name,
+            'message': message
+        }
+        if fields:
+            event.update(fields)
+
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            with self.stats_lock:
+                self.stats['dropped'] += 1
+            return False
+
+        depth = self.events.qsize()
+        with self.stats_lock:
+            self.stats['enqueued'] += 1
+            if depth > self.stats['max_depth']:
+                self.stats['max_depth'] = depth
+        return True
+
+    def metrics(self):
+        with self.stats_lock:
+            stats = dict(self.stats)
+        return dict(stats, queue_size=self.events.qsize(), queue_capacity=self.events.maxsize)
+
+    def _run(self):
+        while self.running.is_set() or not self.events.empty():
+            try:
+                batch = [self.events.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.events.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+
+    def _write(self, batch):
+        written = errors = 0
+        for event in batch:
+            try:
+                self.file.write(json.dumps(event, default=str) + "\n")
+                written += 1
+            except Exception:
+                errors += 1
+
+        try:
+            self.file.flush()
+            if self.file.tell() >= self.max_bytes:
+                self._rotate()
+        except Exception:
+            errors += 1
+
+        with self.stats_lock:
+            self.stats['written'] += written
+            self.stats['errors'] += errors
+            self.stats['batches'] += 1
+
+    def _rotate(self):
+        self.file.close()
+        try:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.log_path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.log_path}.{index + 1}")
+            if self.backup_count > 0:
+                os.replace(self.log_path, f"{self.log_path}.1")
+            else:
+                os.remove(self.log_path)
+        finally:
+            # Reopened even when a rename fails, so later events still have a file to go to
+            self.file = open(self.log_path, "a", encoding="utf-8")
+        with self.stats_lock:
+            self.stats['rotations'] += 1
@@ -0,0 +1,35 @@
+class HandleRegistry:
+    """Resolves X-Plane dataref and command paths to handles once, so the
+    intent handlers never do string lookups on the command hot path."""
+
+    def __init__(self, xp):
+        self.xp = xp
+        self.datarefs = {}
+        self.commands = {}
+        self.missing = []
+
+    def resolve(self, dataref_paths=(), command_paths=()):
+        self.datarefs.clear()
+        self.commands.clear()
+        self.missing = []
+
+        for path in dataref_paths:
+            handle = self.xp.findDataRef(path)
+            if handle is None:
+                self.missing.append(('dataref', path))
+            else:
+                self.datarefs[path] = handle
+
+        for path in command_paths:
+            handle = self.xp.findCommand(path)
+            if handle is None:
+                self.missing.append(('command', path))
+            else:
+                self.commands[path] = handle
+
+        return {
+            'datarefs': len(self.datarefs),
+            'commands': len(self.commands),
+            'missing': list(self.missing)
+        }
+
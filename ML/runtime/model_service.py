@@ -0,0 +1,239 @@
+import gc
+import time
+import threading
+import traceback
+
+from core import normalize_aviation_input
+from utils import trace_stage
+from runtime.prediction_cache import PredictionCache
+
+
+WARMUP_COMMANDS = [
+    "gear up",
+    "flaps down",
+    "autopilot 1 on",
+    "set heading 270",
+    "climb to 15000 feet",
+    "maintain flight level 350",
+    "set com 1 to 121.5",
+]
+
+
+class ModelNotReadyError(RuntimeError):
+    pass
+
+
+class ModelService:
+    """Loads the NLU model on a background thread and warms it up with a few
+    representative commands, so plugin start never blocks the sim and the
+    first real command does not pay one-time allocation costs. `loader` is a
+    ModelLoader or a function returning one, called on the loading thread so
+    importing torch and transformers stays off the caller's thread too.
+
+    With a loader function, reload() loads another model version next to the
+    running one and swaps it in once warm. Commands already running finish on
+    the model they started with; the old model is released after the swap."""
+
+    LOADING = "loading"
+    WARMING = "warming"
+    READY = "ready"
+    FAILED = "failed"
+
+    def __init__(self, loader, warmup_commands=WARMUP_COMMANDS, cache_size=512, fast_path=None, log=print):
+        self.loader_factory = loader if callable(loader) else None
+        self.loader = None if callable(loader) else loader
+        self.session = None
+        self.fast_path = fast_path
+        self.warmup_commands = warmup_commands
+        self.log = log
+        self.cache = PredictionCache(cache_size)
+        self.model_version = None
+        # Guards the (loader, session, model_version) triple that a swap replaces
+        self.swap_lock = threading.Lock()
+
+        self.state = None
+        self.error = None
+        self.timings = {}
+        self.thread = None
+
+        self.reload_thread = None
+        # Makes the check-and-start in reload() atomic; the watcher and the sim thread can both call it
+        self.reload_lock = threading.Lock()
+        self.reloads = 0
+        self.last_reload = None
+
+    def start(self, model_path=None):
+        if self.thread and self.thread.is_alive():
+            return
+        self.state = self.LOADING
+        self.error = None
+        self.thread = threading.Thread(target=self._load, args=(model_path,), name="VimaanModelLoader", daemon=True)
+        self.thread.start()
+
+    def is_ready(self):
+        return self.state == self.READY
+
+    def is_reloading(self):
+        return self.reload_thread is not None and self.reload_thread.is_alive()
+
+    def predict(self, text, trace=None, cache=True):
+        """`cache=False` neither reads nor fills the prediction cache, for speculative
+        predictions on partial transcripts; remember() stores one once it is committed."""
+        if self.state != self.READY:
+            raise ModelNotReadyError(f"Model is {self.state}")
+        return self._predict(text, trace, cache)
+
+    def remember(self, result):
+        # Template matches are never cached; model results carry the version that produced them
+        if 'model_version' in result:
+            self.cache.put(result['normalized_text'], result, result['model_version'])
+
+    def _predict(self, text, trace=None, cache=True):
+        with trace_stage(trace, 'normalize'):
+            text_normalized = normalize_aviation_input(text)
+
+        # Template matches come first so a phrase resolves the same way whether or not it is cached
+        if self.fast_path is not None:
+            with trace_stage(trace, 'template'):
+                result = self.fast_path.match(text, text_normalized)
+            if result is not None:
+                result['cached'] = False
+                return result
+
+        result = self.cache.get(text_normalized) if cache else None
+        if result is not None:
+            result['original_text'] = text
+            result['cached'] = True
+            return result
+
+        # The whole call stays on the session it started with, even if a reload swaps it meanwhile
+        with self.swap_lock:
+            session, version = self.session, self.model_version
+        result = session.predict(text, trace=trace, text_normalized=text_normalized)
+        result['model_version'] = version
+        if cache:
+            self.cache.put(text_normalized, result, version)
+        result['cached'] = False
+        return result
+
+    def _prepare(self, loader, model_path):
+        # Loads and warms a model without touching the one being served
+        results = loader.load_all(model_path)
+        loaded = time.perf_counter()
+        if self.state == self.LOADING:
+            self.state = self.WARMING
+
+        # The template fast path and the cache are skipped, so warm-up runs real
+        # forward passes; the results seed the cache once this model is active
+        warmed = []
+        for command in self.warmup_commands:
+            text_normalized = normalize_aviation_input(command)
+            warmed.append((text_normalized, loader.session.predict(command, text_normalized=text_normalized)))
+        return results, loaded, warmed
+
+    def _activate(self, loader, results, warmed):
+        model_info = results['model']
+        version = (model_info['model_path'], model_info['format'], model_info['quantized'])
+        with self.swap_lock:
+            # A list so _release can empty it and leave no reference behind in the caller
+            previous = [self.loader, self.session]
+            self.loader, self.session, self.model_version = loader, loader.session, version
+            self.cache.set_version(version)
+        for text_normalized, result in warmed:
+            self.cache.put(text_normalized, result, version)
+        return previous
+
+    def _release(self, previous):
+        loader, session = previous
+        previous.clear()
+        # A forward pass already running on the old session holds its lock; wait for it.
+        # Calls that picked the old session just before the swap keep it alive until they return.
+        if session is not None:
+            with session.lock:
+                pass
+        device = getattr(loader, 'device', None)
+        if loader is not None:
+            loader.model = loader.session = loader.tokenizer = None
+        del loader, session
+        gc.collect()
+        if device is not None and device.type == 'cuda':
+            import torch
+            torch.cuda.empty_cache()
+
+    def _load(self, model_path):
+        start = time.perf_counter()
+        try:
+            loader = self.loader or self.loader_factory()
+            results, loaded, warmed = self._prepare(loader, model_path)
+            self._activate(loader, results, warmed)
+            ready = time.perf_counter()
+            self.log(f"[Vimaan] Model loaded from: {results['model']['model_path']}")
+            self.log(f"[Vimaan] Device: {results['model']['device']}, threads: {results['threads']}")
+            self.log(f"[Vimaan] Intents: {results['maps']['intents']}, Slots: {results['maps']['slots']}")
+
+            self.timings = {
+                'load_s': loaded - start,
+                'warmup_s': ready - loaded,
+                'time_to_ready_s': ready - start
+            }
+            self.state = self.READY
+            self.log(
+                f"[Vimaan] Model ready in {self.timings['time_to_ready_s']:.2f}s "
+                f"(load {self.timings['load_s']:.2f}s, warm-up {self.timings['warmup_s']:.2f}s "
+                f"over {len(self.warmup_commands)} commands)"
+            )
+        except Exception as e:
+            self.error = str(e)
+            self.state = self.FAILED
+            self.log(f"[Vimaan] ERROR loading model: {str(e)}")
+            self.log(f"[Vimaan] Traceback: {traceback.format_exc()}")
+
+    def reload(self, model_path=None):
+        """Loads `model_path` (default: the promoted model) in the background and
+        swaps it in when warm. Returns False if a load or reload is already running."""
+        if self.loader_factory is None:
+            raise RuntimeError("reload() needs ModelService to be created with a loader function")
+        with self.reload_lock:
+            if self.state == self.FAILED:
+                self.start(model_path)
+                return True
+            if self.state != self.READY or self.is_reloading():
+                return False
+            self.reload_thread = threading.Thread(
+                target=self._reload, args=(model_path,), name="VimaanModelReload", daemon=True
+            )
+            self.reload_thread.start()
+            return True
+
+    def _reload(self, model_path):
+        start = time.perf_counter()
+        try:
+            loader = self.loader_factory()
+            results, loaded, warmed = self._prepare(loader, model_path)
+            previous_version = self.model_version
+            previous = self._activate(loader, results, warmed)
+            swapped = time.perf_counter()
+            del loader
+            self._release(previous)
+
+            self.last_reload = {
+                'id': self.reloads + 1,
+                'status': 'swapped',
+                'model_path': results['model']['model_path'],
+                'previous_version': previous_version,
+                'version': self.model_version,
+                'load_s': loaded - start,
+                'warmup_s': swapped - loaded,
+                'release_s': time.perf_counter() - swapped,
+                'error': None
+            }
+            self.log(
+                f"[Vimaan] Model swapped to {results['model']['model_path']} ({results['model']['format']}) "
+                f"after {swapped - start:.2f}s in the background, previous model released"
+            )
+        except Exception as e:
+            # The running model was never touched and keeps serving
+            self.last_reload = {'id': self.reloads + 1, 'status': 'failed', 'model_path': model_path, 'error': str(e)}
+            self.log(f"[Vimaan] ERROR reloading model, keeping the current one: {str(e)}")
+            self.log(f"[Vimaan] Traceback: {traceback.format_exc()}")
+        self.reloads += 1
@@ -0,0 +1,42 @@
+import numpy as np
+
+
+SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+
+def chunk_energy(chunk, sample_width):
+    samples = np.frombuffer(chunk, dtype=SAMPLE_DTYPES[sample_width]).astype(np.float32)
+    if samples.size == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(samples * samples)))
+
+
+class NoiseFloorEstimator:
+    """Tracks the ambient noise floor from idle microphone audio and keeps
+    recognizer.energy_threshold current, using the same damped update as
+    speech_recognition's adjust_for_ambient_noise. Only every Nth idle chunk
+    is measured to keep the cost negligible."""
+
+    def __init__(self, recognizer, every_n_chunks=4, min_threshold=50):
+        self.recognizer = recognizer
+        self.every_n_chunks = every_n_chunks
+        self.min_threshold = min_threshold
+        self.counter = 0
+        self.noise_energy = None
+
+    @property
+    def threshold(self):
+        return self.recognizer.energy_threshold
+
+    def update(self, chunk, sample_width, seconds_per_chunk):
+        self.counter += 1
+        if self.counter % self.every_n_chunks:
+            return
+
+        energy = chunk_energy(chunk, sample_width)
+        self.noise_energy = energy
+
+        damping = self.recognizer.dynamic_energy_adjustment_damping ** (seconds_per_chunk * self.every_n_chunks)
+        target_energy = energy * self.recognizer.dynamic_energy_ratio
+        threshold = self.recognizer.energy_threshold * damping + target_energy * (1 - damping)
+        self.recognizer.energy_threshold = max(self.min_threshold, threshold)
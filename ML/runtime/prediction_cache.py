@@ -0,0 +1,64 @@
+import copy
+import threading
+from collections import OrderedDict
+
+
+class PredictionCache:
+    """Bounded LRU of prediction results keyed on (normalized text, model version).
+    Pilots repeat a small set of phrases, so most commands after the first few
+    skip tokenization and the forward pass entirely."""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.version = None
+        self.counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def set_version(self, version):
+        # A different model can label the same text differently, so nothing carries over
+        with self.lock:
+            if version != self.version:
+                if self.entries:
+                    self.counters['invalidations'] += 1
+                self.entries.clear()
+                self.version = version
+
+    def get(self, normalized_text):
+        key = (normalized_text, self.version)
+        with self.lock:
+            result = self.entries.get(key)
+            if result is None:
+                self.counters['misses'] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.counters['hits'] += 1
+        # Callers get their own copy, results are mutated downstream (slots, postprocessing)
+        return copy.deepcopy(result)
+
+    def put(self, normalized_text, result, version=None):
+        if self.max_entries <= 0:
+            return
+        with self.lock:
+            # A prediction that finishes after a model swap belongs to the old version
+            if version is not None and version != self.version:
+                return
+            key = (normalized_text, self.version)
+            self.entries[key] = copy.deepcopy(result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.counters['evictions'] += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.counters['hits'] + self.counters['misses']
+            return {
+                **self.counters,
+                'size': len(self.entries),
+                'hit_rate': self.counters['hits'] / lookups if lookups else 0.0
+            }
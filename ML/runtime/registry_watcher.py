@@ -0,0 +1,63 @@
+import os
+import threading
+
+from utils import ModelRegistry
+
+
+class RegistryWatcher:
+    """Polls the model registry on a background thread and calls
+    on_promoted(model_path) when a different version is promoted. Between
+    changes a poll is a single stat of registry.json. If on_promoted returns
+    False (e.g. a load is still running) the change is retried next poll."""
+
+    def __init__(self, on_promoted, registry=None, interval=5.0, log=print):
+        self.registry = registry or ModelRegistry()
+        self.on_promoted = on_promoted
+        self.interval = interval
+        self.log = log
+
+        self.current = None
+        self.mtime = None
+        self.stopping = threading.Event()
+        self.thread = None
+
+    def start(self, current_path=None):
+        if self.thread and self.thread.is_alive():
+            return
+        self.current = current_path or self.registry.promoted_path()
+        self.mtime = self._mtime()
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self._run, name="VimaanRegistryWatcher", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=2.0):
+        if not self.thread:
+            return
+        self.stopping.set()
+        self.thread.join(timeout=timeout)
+        self.thread = None
+
+    def _mtime(self):
+        try:
+            return os.path.getmtime(self.registry.path)
+        except OSError:
+            return None
+
+    def _run(self):
+        while not self.stopping.wait(self.interval):
+            mtime = self._mtime()
+            if mtime is None or mtime == self.mtime:
+                continue
+            try:
+                promoted = self.registry.promoted_path()
+            except (OSError, ValueError) as e:
+                self.log(f"[Vimaan] Could not read the model registry: {str(e)}")
+                continue
+            self.mtime = mtime
+
+            if promoted and promoted != self.current:
+                self.log(f"[Vimaan] Registry promoted {os.path.basename(promoted)}, reloading in the background")
+                if self.on_promoted(promoted):
+                    self.current = promoted
+                else:
+                    self.mtime = None
@@ -0,0 +1,159 @@
+import queue
+import itertools
+import threading
+
+import speech_recognition as sr
+
+
+class SpeculativeInterpreter:
+    """Streams captured audio into a streaming ASR backend on its own thread
+    and runs NLU on every new partial hypothesis while the key is still held.
+    The latest speculative prediction is only committed when the final
+    transcript normalizes to the same text; otherwise the caller falls back
+    to a normal predict on the final transcript."""
+
+    def __init__(self, asr, interpret, normalize, max_pending=2048, log=print):
+        self.asr = asr
+        self.interpret = interpret
+        self.normalize = normalize
+        self.log = log
+
+        self.messages = queue.Queue(maxsize=max_pending)
+        self.utterance_ids = itertools.count(1)
+        self.current = None
+        # Utterances that lost a message to a full queue; they fall back to full NLU
+        self.overflowed = set()
+        self.feeding = None
+        self.speculation = None
+
+        self.finished = {}
+        self.finished_changed = threading.Condition()
+        self.thread = None
+
+        self.stats = {
+            'partials': 0,
+            'speculations': 0,
+            'committed': 0,
+            'rejected': 0,
+            'fallbacks': 0
+        }
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.thread = threading.Thread(target=self._run, name="VimaanSpeculation", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=2.0):
+        if not self.thread:
+            return
+        self.messages.put(('stop', None, None))
+        self.thread.join(timeout=timeout)
+        self.thread = None
+
+    # begin/feed/end run on the sim and audio threads, so they never block on a full queue
+
+    def begin(self):
+        utterance = next(self.utterance_ids)
+        self.feeding = utterance
+        try:
+            self.messages.put_nowait(('begin', utterance, None))
+        except queue.Full:
+            self.overflowed.add(utterance)
+        return utterance
+
+    def feed(self, chunk, sample_rate, sample_width):
+        try:
+            self.messages.put_nowait(('chunk', None, (chunk, sample_rate, sample_width)))
+        except queue.Full:
+            self.overflowed.add(self.feeding)
+
+    def end(self, utterance):
+        self.feeding = None
+        try:
+            self.messages.put_nowait(('end', utterance, None))
+        except queue.Full:
+            # The streaming thread will never see this end; publish the fallback now
+            self.overflowed.add(utterance)
+            self._publish(utterance, None)
+
+    def collect(self, utterance, timeout=2.0):
+        """Waits for the streamed result of `utterance`. Returns None when the
+        stream is unusable, in which case the full audio must be transcribed."""
+        with self.finished_changed:
+            self.finished_changed.wait_for(lambda: utterance in self.finished, timeout=timeout)
+            streamed = self.finished.pop(utterance, None)
+
+        if streamed is None:
+            self.stats['fallbacks'] += 1
+        return streamed
+
+    def commit(self, streamed, text):
+        speculation = streamed['speculation'] if streamed else None
+        if speculation is None:
+            return None
+
+        if speculation['normalized'] == self.normalize(text):
+            self.stats['committed'] += 1
+            return speculation['prediction']
+
+        self.stats['rejected'] += 1
+        return None
+
+    def _run(self):
+        while True:
+            kind, utterance, payload = self.messages.get()
+            if kind == 'stop':
+                break
+            try:
+                if kind == 'begin':
+                    self.current = utterance
+                    self.speculation = None
+                    self.asr.start_stream()
+                elif kind == 'chunk' and self.current is not None:
+                    partial = self.asr.feed_stream(*payload)
+                    if partial:
+                        self.stats['partials'] += 1
+                        self._speculate(partial)
+                elif kind == 'end':
+                    self._finish(utterance)
+            except Exception as e:
+                self.log(f"[Vimaan] Streaming recognition error: {str(e)}")
+                if kind == 'end':
+                    self._publish(utterance, None)
+                self.current = None
+
+    def _speculate(self, partial):
+        normalized = self.normalize(partial)
+        if self.speculation and self.speculation['normalized'] == normalized:
+            return
+        self.speculation = {
+            'normalized': normalized,
+            'prediction': self.interpret(partial)
+        }
+        self.stats['speculations'] += 1
+
+    def _finish(self, utterance):
+        if utterance != self.current or utterance in self.overflowed:
+            self._publish(utterance, None)
+            return
+
+        self.current = None
+        try:
+            transcript = self.asr.finish_stream()
+        except sr.UnknownValueError:
+            transcript = None
+
+        self._publish(utterance, {
+            'transcript': transcript,
+            'speculation': self.speculation if transcript else None
+        })
+
+    def _publish(self, utterance, streamed):
+        self.overflowed.discard(utterance)
+        with self.finished_changed:
+            self.finished[utterance] = streamed
+            # Drop results nobody collected (e.g. a worker timed out waiting for them)
+            for stale in [u for u in self.finished if u < utterance - 4]:
+                del self.finished[stale]
+            self.finished_changed.notify_all()
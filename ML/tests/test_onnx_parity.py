@@ -0,0 +1,47 @@
+import os
+import sys
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("onnxruntime")
+
+ml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ml_path)
+
+from core.model_loader import ModelLoader
+from core.onnx_backend import OnnxJointModel, ONNX_FILENAME
+from command_tester import TEST_COMMANDS
+from utils import get_latest_model_path
+
+
+# fp32 ONNX Runtime vs eager torch; graph fusions only reorder float arithmetic
+LOGIT_ATOL = 1e-4
+
+
+@pytest.fixture(scope="module")
+def model_path():
+    # VIMAAN_TEST_MODEL points the test at a model directory; default is the promoted model
+    model_path = os.environ.get("VIMAAN_TEST_MODEL") or get_latest_model_path()
+    if not model_path or not os.path.exists(os.path.join(model_path, ONNX_FILENAME)):
+        pytest.skip("no trained model with an exported model.onnx")
+    return model_path
+
+
+def test_onnx_logits_match_eager(model_path):
+    eager_loader = ModelLoader(torch.device("cpu"), use_torchscript=False, use_bundle=False)
+    eager_loader.load_all(model_path)
+    onnx_model = OnnxJointModel(os.path.join(model_path, ONNX_FILENAME))
+    texts = [text for text, _ in TEST_COMMANDS]
+    encoding = eager_loader.tokenizer(texts, padding='longest', return_tensors='pt')
+
+    with torch.inference_mode():
+        _, eager_intents, eager_slots = eager_loader.model(encoding['input_ids'], encoding['attention_mask'])
+    _, onnx_intents, onnx_slots = onnx_model(encoding['input_ids'], encoding['attention_mask'])
+
+    torch.testing.assert_close(onnx_intents, eager_intents, atol=LOGIT_ATOL, rtol=0)
+    mask = encoding['attention_mask'].bool()
+    torch.testing.assert_close(onnx_slots[mask], eager_slots[mask], atol=LOGIT_ATOL, rtol=0)
+    assert torch.equal(onnx_intents.argmax(dim=1), eager_intents.argmax(dim=1))
+    assert torch.equal(onnx_slots.argmax(dim=2)[mask], eager_slots.argmax(dim=2)[mask])
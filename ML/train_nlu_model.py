@@ -9,7 +9,7 @@ import numpy as np
 import os
 from core import normalize_dataset, JointIntentAndSlotModel
 from core.postprocessor import add_implicit_state, extract_digit_sequence_frequency
-from utils import find_latest_version_path, get_next_version_path, get_model_versions_dir
+from utils import find_latest_version_path, ModelRegistry
 
 
 try:
@@ -127,22 +127,14 @@ def train_model(dataset_path):
     optimizer = AdamW(model.parameters(), lr=5e-5)
     
     best_val_loss = float('inf')
+    best_epoch = None
     epochs_no_improve = 0
     patience = 2
     
-    models_dir = get_model_versions_dir()
-    latest_version = 0
-    if os.path.exists(models_dir):
-        for item in os.listdir(models_dir):
-            if item.startswith('v'):
-                try:
-                    ver = int(item[1:])
-                    latest_version = max(latest_version, ver)
-                except:
-                    pass
-
-    next_version = f"v{latest_version + 1}"
-    model_save_path = os.path.join(models_dir, next_version)
+    registry = ModelRegistry()
+    # With registry.json in place the plugin ignores the unregistered vN written below until it is final
+    registry.initialize()
+    model_save_path = registry.next_version_path()
 
     print("\nStarting training...")
     numOfEpochs = 10
@@ -182,6 +174,7 @@ def train_model(dataset_path):
         
         if avg_val_loss < best_val_loss:
             best_val_loss = avg_val_loss
+            best_epoch = epoch + 1
             epochs_no_improve = 0
             
             print(f"Validation loss improved! Saving best model to {model_save_path}")
@@ -197,6 +190,22 @@ def train_model(dataset_path):
             if epochs_no_improve >= patience:
                 print(f"Early stopping triggered after {epoch+1} epochs.")
                 break 
+    
+    if best_epoch is None:
+        return None
+    
+    # Registered only now that the checkpoint is final, so it can never be loaded half-written
+    metrics = {'val_loss': best_val_loss, 'epoch': best_epoch}
+    promote = registry.is_better(metrics, 'val_loss', higher_is_better=False)
+    version = registry.register(
+        model_save_path, metrics=metrics, promote=promote, dataset=os.path.basename(dataset_path)
+    )
+    if promote:
+        print(f"Registered and promoted {version} (validation loss {best_val_loss:.4f})")
+    else:
+        print(f"Registered {version}, the promoted {registry.promoted()} has a lower validation loss. "
+              f"Promote it anyway with: python manage_models.py promote {version}")
+    return model_save_path
 
 if __name__ == "__main__":
     script_dir = os.path.dirname(__file__)
@@ -2,14 +2,32 @@ from .file_utils import (
     find_latest_version_path,
     get_next_version_path,
     ensure_directory,
+    is_artifact_fresh,
     get_model_versions_dir,
     get_latest_model_path
 )
+from .model_registry import (
+    ModelRegistry,
+    REGISTRY_FILENAME,
+    is_model_complete
+)
+from .latency import (
+    CommandTrace,
+    LatencyRecorder,
+    trace_stage
+)
 
 __all__ = [
     'find_latest_version_path',
     'get_next_version_path',
     'ensure_directory',
+    'is_artifact_fresh',
     'get_model_versions_dir',
-    'get_latest_model_path'
+    'get_latest_model_path',
+    'ModelRegistry',
+    'REGISTRY_FILENAME',
+    'is_model_complete',
+    'CommandTrace',
+    'LatencyRecorder',
+    'trace_stage'
 ]
@@ -45,22 +45,27 @@ def ensure_directory(path):
     return path
 
 
-def get_model_versions_dir(base_dir="models"):
+def is_artifact_fresh(model_path, filename, sources):
+    # A derived artifact is only trusted when it is newer than every file it was built from
+    artifact_path = os.path.join(model_path, filename)
+    if not os.path.exists(artifact_path):
+        return False
+    
+    artifact_mtime = os.path.getmtime(artifact_path)
+    for name in sources:
+        source = os.path.join(model_path, name)
+        if os.path.exists(source) and os.path.getmtime(source) > artifact_mtime:
+            return False
+    return True
+
+
+def get_model_versions_dir(base_dir="models", model_name="vimaan_nlu_model_best"):
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    models_dir = os.path.join(current_dir, "..", base_dir, "vimaan_nlu_model_best")
+    models_dir = os.path.join(current_dir, "..", base_dir, model_name)
     return ensure_directory(models_dir)
 
 
-def get_latest_model_path():
-    models_dir = get_model_versions_dir()
-    versions = []
-    if os.path.exists(models_dir):
-        for item in os.listdir(models_dir):
-            if item.startswith('v') and item[1:].isdigit():
-                versions.append(int(item[1:]))
-    
-    if not versions:
-        return None
-    
-    latest_version = max(versions)
-    return os.path.join(models_dir, f"v{latest_version}")
+def get_latest_model_path(model_name="vimaan_nlu_model_best"):
+    # The promoted version in the registry, not simply the highest vN on disk
+    from .model_registry import ModelRegistry
+    return ModelRegistry(get_model_versions_dir(model_name=model_name)).promoted_path()
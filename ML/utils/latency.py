@@ -0,0 +1,85 @@
+import time
+import uuid
+import threading
+import contextlib
+from collections import defaultdict, deque
+
+
+class CommandTrace:
+    """Per-command stage timings (milliseconds) under a short trace id, so
+    every log line of a command can be tied to where its time went."""
+
+    def __init__(self, trace_id=None):
+        self.trace_id = trace_id or uuid.uuid4().hex[:8]
+        self.started = time.perf_counter()
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def record(self, name, elapsed_ms):
+        self.stages[name] = self.stages.get(name, 0.0) + elapsed_ms
+
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def summary(self):
+        stages = " ".join(f"{name}={ms:.1f}ms" for name, ms in self.stages.items())
+        return f"{stages} total={self.total_ms():.1f}ms"
+
+
+def trace_stage(trace, name):
+    if trace is None:
+        return contextlib.nullcontext()
+    return trace.stage(name)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LatencyRecorder:
+    """Rolling per-stage latency windows with p50/p95/p99 summaries."""
+
+    def __init__(self, window=1000):
+        self.samples = defaultdict(lambda: deque(maxlen=window))
+        self.lock = threading.Lock()
+
+    def add(self, trace):
+        with self.lock:
+            for name, elapsed_ms in trace.stages.items():
+                self.samples[name].append(elapsed_ms)
+            self.samples['total'].append(trace.total_ms())
+
+    def percentiles(self, name):
+        with self.lock:
+            values = sorted(self.samples.get(name, ()))
+        return {
+            'count': len(values),
+            'p50': percentile(values, 0.50),
+            'p95': percentile(values, 0.95),
+            'p99': percentile(values, 0.99)
+        }
+
+    def summary(self):
+        with self.lock:
+            names = list(self.samples)
+        return {name: self.percentiles(name) for name in names}
+
+    def format_summary(self):
+        lines = []
+        for name, stats in self.summary().items():
+            if stats['count']:
+                lines.append(
+                    f"{name:16s} n={stats['count']:<5d} p50={stats['p50']:.1f}ms "
+                    f"p95={stats['p95']:.1f}ms p99={stats['p99']:.1f}ms"
+                )
+        return lines
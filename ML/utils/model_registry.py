@@ -0,0 +1,209 @@
+import os
+import json
+import time
+import hashlib
+from contextlib import contextmanager
+from datetime import datetime
+
+from .file_utils import get_model_versions_dir
+
+
+REGISTRY_FILENAME = "registry.json"
+REGISTRY_FORMAT_VERSION = 1
+# A lock file older than this was left by a writer that died; manifest updates take milliseconds
+STALE_LOCK_S = 60
+# What ModelLoader reads from a vN directory; a version missing any of them is incomplete
+REQUIRED_MODEL_FILES = ("config.json", "intent_classifier.bin", "intent_map.json", "slot_map.json", "tokenizer.json")
+WEIGHT_FILES = ("model.safetensors", "pytorch_model.bin")
+# Hashed files; exports built later (ONNX, TorchScript, int8 cache, bundle) do not change a version's hash
+HASHED_FILES = REQUIRED_MODEL_FILES + WEIGHT_FILES + (
+    "vocab.txt", "special_tokens_map.json", "tokenizer_config.json", "distillation.json"
+)
+
+
+def is_model_complete(model_path):
+    return (
+        all(os.path.isfile(os.path.join(model_path, name)) for name in REQUIRED_MODEL_FILES)
+        and any(os.path.isfile(os.path.join(model_path, name)) for name in WEIGHT_FILES)
+    )
+
+
+def hash_model_files(model_path):
+    # One digest over the saved files (name and content) in a stable order, plus their sizes
+    digest = hashlib.sha256()
+    files = {}
+    for name in sorted(HASHED_FILES):
+        file_path = os.path.join(model_path, name)
+        if not os.path.isfile(file_path):
+            continue
+        digest.update(name.encode("utf-8") + b"\0")
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        files[name] = os.path.getsize(file_path)
+    return digest.hexdigest(), files
+
+
+class ModelRegistry:
+    """registry.json next to the vN directories of one model family. It records
+    every finished version (metrics, content hash, size, creation time) and
+    which one is promoted. Versions are only registered once fully written, so
+    resolving the promoted model never sees a half-saved checkpoint. Updates
+    hold a lock file, so concurrent writers (a training run, manage_models.py)
+    never lose each other's entries."""
+
+    def __init__(self, models_dir=None):
+        self.models_dir = models_dir or get_model_versions_dir()
+        self.path = os.path.join(self.models_dir, REGISTRY_FILENAME)
+        self.lock_path = self.path + ".lock"
+
+    def read(self):
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "r") as f:
+            return json.load(f)
+
+    def _manifest(self):
+        return self.read() or {'format_version': REGISTRY_FORMAT_VERSION, 'promoted': None, 'versions': {}}
+
+    @contextmanager
+    def _locked(self, timeout=10.0):
+        # O_EXCL creation is atomic on every platform the plugin runs on, unlike fcntl/msvcrt
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                os.close(os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.lock_path) > STALE_LOCK_S:
+                        os.remove(self.lock_path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{self.lock_path} is held by another writer")
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            os.remove(self.lock_path)
+
+    @contextmanager
+    def _update(self):
+        # Read-modify-write of the manifest under the lock
+        with self._locked():
+            manifest = self._manifest()
+            yield manifest
+            self._write(manifest)
+
+    def _write(self, manifest):
+        # Readers see the old manifest or the new one, never a partial write
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def version_path(self, version):
+        return os.path.join(self.models_dir, version)
+
+    def versions(self):
+        return self._manifest()['versions']
+
+    def promoted(self):
+        return self._manifest()['promoted']
+
+    def promoted_path(self):
+        manifest = self.read()
+        if manifest is None:
+            return self._latest_complete_path()
+        promoted = manifest.get('promoted')
+        if promoted:
+            return self.version_path(promoted)
+        # Nothing promoted yet: the newest registered version; unregistered vN may still be being written
+        return self._latest_complete_path(manifest['versions'])
+
+    def _latest_complete_path(self, registered=None):
+        # Trees saved before the registry existed: the newest complete vN, until `manage_models.py bootstrap`
+        # or a training run creates registry.json
+        versions = [
+            int(item[1:]) for item in os.listdir(self.models_dir)
+            if item.startswith('v') and item[1:].isdigit() and (registered is None or item in registered)
+            and is_model_complete(self.version_path(item))
+        ]
+        return self.version_path(f"v{max(versions)}") if versions else None
+
+    def initialize(self):
+        """Creates registry.json if it does not exist yet, registering the complete
+        vN directories already on disk. Call it before writing a new version: from
+        then on only registered versions are ever resolved."""
+        if self.read() is None:
+            self.bootstrap()
+
+    def next_version_path(self):
+        # Skips unregistered directories too, e.g. left behind by an interrupted run
+        number = max((int(v[1:]) for v in self.versions()), default=0) + 1
+        while os.path.exists(self.version_path(f"v{number}")):
+            number += 1
+        return self.version_path(f"v{number}")
+
+    def register(self, model_path, metrics=None, promote=False, **details):
+        version = os.path.basename(os.path.normpath(model_path))
+        if not is_model_complete(model_path):
+            raise FileNotFoundError(f"{model_path} is not a complete model, refusing to register it")
+
+        sha256, files = hash_model_files(model_path)
+        entry = {
+            'created_at': datetime.fromtimestamp(
+                max(os.path.getmtime(os.path.join(model_path, name)) for name in files)
+            ).isoformat(timespec='seconds'),
+            'registered_at': datetime.now().isoformat(timespec='seconds'),
+            'metrics': metrics or {},
+            'sha256': sha256,
+            'size_bytes': sum(files.values()),
+            'files': files,
+            **details
+        }
+
+        with self._update() as manifest:
+            manifest['versions'][version] = entry
+            if promote:
+                manifest['promoted'] = version
+        return version
+
+    def promote(self, version):
+        with self._update() as manifest:
+            if version not in manifest['versions']:
+                raise KeyError(f"{version} is not registered in {self.path}")
+            manifest['promoted'] = version
+
+    def is_better(self, metrics, metric, higher_is_better=True):
+        # True when nothing is promoted yet or the promoted version never recorded this metric
+        manifest = self._manifest()
+        promoted = manifest['versions'].get(manifest['promoted'] or "", {})
+        current = promoted.get('metrics', {}).get(metric)
+        if current is None:
+            return True
+        return metrics[metric] > current if higher_is_better else metrics[metric] < current
+
+    def verify(self, version):
+        entry = self.versions().get(version)
+        if entry is None:
+            raise KeyError(f"{version} is not registered in {self.path}")
+        sha256, files = hash_model_files(self.version_path(version))
+        return sha256 == entry['sha256'] and files == entry['files']
+
+    def bootstrap(self):
+        # Registers every complete vN directory already on disk and promotes the newest;
+        # writes registry.json even when there is nothing to register yet
+        registered = []
+        for item in sorted(os.listdir(self.models_dir), key=lambda name: (len(name), name)):
+            path = self.version_path(item)
+            if item.startswith('v') and item[1:].isdigit() and item not in self.versions() and is_model_complete(path):
+                registered.append(self.register(path))
+        with self._update() as manifest:
+            if manifest['versions'] and not manifest['promoted']:
+                manifest['promoted'] = max(manifest['versions'], key=lambda v: int(v[1:]))
+        return registered
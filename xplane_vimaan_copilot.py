@@ -1,8 +1,8 @@
 import os
 import sys
 import json
-import torch
-import logging
+import time
+import threading
 import speech_recognition as sr
 from datetime import datetime
 from XPPython3 import xp
@@ -10,36 +10,87 @@ from XPPython3 import xp
 ml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ML")
 sys.path.insert(0, ml_path)
 
-from core.model_loader import ModelLoader
-from core.inference import predict
+from core.template_matcher import TemplateMatcher
+from core.normalization import normalize_aviation_input
+from utils import CommandTrace, LatencyRecorder, trace_stage
+from config.action_config import ACTIONS
+from runtime import (
+    AudioCapture,
+    AsyncEventLog,
+    NoiseFloorEstimator,
+    CommandWorker,
+    SpeculativeInterpreter,
+    ModelService,
+    RegistryWatcher,
+    HandleRegistry,
+    compile_actions,
+    action_paths,
+    create_asr_backend
+)
 
 
 class PythonInterface:
     
+    FLIGHT_LOOP_INTERVAL = -1.0
+    
     def __init__(self):
+        self.startedAt = time.perf_counter()
         self.Name = "Vimaan AI CoPilot"
         self.Sig = "plugin.vimaan.aicopilot.bymhr"
         self.Desc = "Advanced Voice Command Interface with Intent & Slot Recognition for X-Plane"
         
+        self._sim_thread_id = threading.get_ident()
         self._setup_logging()
         
         self.recognizer = sr.Recognizer()
         self.microphone = self._setup_microphone()
+        self.noiseFloor = NoiseFloorEstimator(self.recognizer)
+        self.capture = AudioCapture(self.microphone, noise_floor=self.noiseFloor, log=self.log) if self.microphone else None
         self.isRecording = False
-        self.audioData = None
+        self.utterance = None
+        self.asr = self._setup_asr()
         
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        self.log(f"[Vimaan] Using device: {self.device}")
+        # VIMAAN_NLU_BACKEND=onnx runs the exported graph on ONNX Runtime (see ML/export_onnx.py)
+        backend = os.environ.get("VIMAAN_NLU_BACKEND", "torch").lower()
+        # VIMAAN_NLU_QUANTIZE=1 loads int8 dynamic-quantized weights on CPU (see ML/benchmarks/quantization_report.py)
+        quantize = os.environ.get("VIMAAN_NLU_QUANTIZE", "0") == "1"
+        # Exact template matches skip the transformer; VIMAAN_TEMPLATE_FAST_PATH=0 sends everything to the model
+        fast_path = TemplateMatcher() if os.environ.get("VIMAAN_TEMPLATE_FAST_PATH", "1") == "1" else None
+        # Keep inference off most cores so it does not fight X-Plane's own threads (VIMAAN_NLU_THREADS)
+        threads = int(os.environ.get("VIMAAN_NLU_THREADS", min(2, os.cpu_count() or 1)))
+        # The loader is built on the loading thread: torch and transformers take
+        # seconds to import and the plugin module deliberately does not import them
+        self.model_service = ModelService(
+            lambda: self._create_model_loader(backend, quantize, threads),
+            fast_path=fast_path,
+            log=self.log
+        )
+        self.modelStateAnnounced = None
+        self.modelReloadAnnounced = None
+        # A newly promoted version in the registry is loaded and swapped in without
+        # restarting X-Plane; VIMAAN_MODEL_WATCH_INTERVAL=0 leaves it to the reload command
+        watch_interval = float(os.environ.get("VIMAAN_MODEL_WATCH_INTERVAL", "5"))
+        self.modelWatcher = RegistryWatcher(self._on_model_promoted, interval=watch_interval, log=self.log) \
+            if watch_interval > 0 else None
+        self.reloadCommand = None
+        self.latency = LatencyRecorder()
         
-        self.loader = ModelLoader(self.device)
-        self._init_model()
+        self.worker = CommandWorker(self._recognize, self.InterpretCommand, log=self.log)
+        self.speculator = self._setup_speculation()
+        self.handles = HandleRegistry(xp)
+        self.actions = {}
         
         self.hotkeyPress = None
         self.hotkeyRelease = None
-        
-        self.intent_to_command = self._setup_intent_handlers()
+        self.flightLoopRegistered = False
+    
+    def _create_model_loader(self, backend, quantize, threads):
+        from core.model_loader import ModelLoader
+        # No device given: CUDA when available, CPU otherwise (ModelService logs the choice)
+        return ModelLoader(backend=backend, quantize=quantize, intra_op_threads=threads, inter_op_threads=1)
     
     def _setup_logging(self):
+        self.events = None
         try:
             desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
             log_folder = os.path.join(desktop_path, "Vimaan_Logs")
@@ -48,69 +99,66 @@ class PythonInterface:
                 os.makedirs(log_folder)
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_file = os.path.join(log_folder, f"vimaan_plugin_{timestamp}.log")
-            
-            logging.basicConfig(
-                level=logging.DEBUG,
-                format='%(asctime)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler(log_file, mode='w', encoding='utf-8'),
-                    logging.StreamHandler()
-                ]
-            )
+            log_file = os.path.join(log_folder, f"vimaan_plugin_{timestamp}.jsonl")
             
-            self.logger = logging.getLogger('VimaaNCoPilot')
-            self.logger.info("=== VIMAAN AI COPILOT LOG START ===")
-            self.logger.info(f"Log file: {log_file}")
+            self.events = AsyncEventLog(log_file)
+            self.events.start()
+            self.log("=== VIMAAN AI COPILOT LOG START ===")
+            self.log(f"Log file: {log_file}")
             
         except Exception as e:
-            self.logger = None
-            self.log(f"[Vimaan] Failed to setup logging: {str(e)}")
+            self.events = None
+            self.log(f"[Vimaan] Failed to setup logging: {str(e)}", level="ERROR")
     
-    def log(self, message):
-        try:
-            xp.log(message)
-        except:
-            pass
+    def log(self, message, level="INFO", **fields):
+        # The hot path only enqueues; the event log thread does all file I/O
+        if self.events:
+            self.events.emit(message, level, **fields)
         
-        if self.logger:
-            self.logger.info(message)
+        # xp.log is synchronous file I/O and sim-thread only, so keep it for problems
+        if (level != "INFO" or self.events is None) and threading.get_ident() == self._sim_thread_id:
+            try:
+                xp.log(message)
+            except:
+                pass
     
     def _setup_microphone(self):
         try:
             return sr.Microphone()
         except AttributeError:
-            self.log("[Vimaan] WARNING: PyAudio not available - microphone may not work")
+            self.log("[Vimaan] WARNING: PyAudio not available - microphone may not work", level="WARNING")
             return None
     
-    def _init_model(self):
+    def _setup_asr(self):
+        # VIMAAN_ASR_BACKEND selects the engine: google (default), vosk (offline) or file (test stub)
+        backend = os.environ.get("VIMAAN_ASR_BACKEND", "google").lower()
+        options = {
+            'google': {'recognizer': self.recognizer},
+            'vosk': {'model_path': os.environ.get("VIMAAN_VOSK_MODEL", os.path.join(ml_path, "models", "vosk"))},
+            'file': {'transcripts_path': os.environ.get("VIMAAN_ASR_TRANSCRIPTS", "")},
+        }
         try:
-            results = self.loader.load_all()
-            self.log(f"[Vimaan] Model loaded from: {results['model']['model_path']}")
-            self.log(f"[Vimaan] Device: {results['model']['device']}")
-            self.log(f"[Vimaan] Intents: {results['maps']['intents']}, Slots: {results['maps']['slots']}")
+            asr = create_asr_backend(backend, **options.get(backend, {}))
         except Exception as e:
-            self.log(f"[Vimaan] ERROR loading model: {str(e)}")
-            raise
+            self.log(f"[Vimaan] ASR backend '{backend}' unavailable ({str(e)}), falling back to google", level="WARNING")
+            asr = create_asr_backend('google', **options['google'])
+        self.log(f"[Vimaan] ASR backend: {asr.name}")
+        return asr
     
-    def _setup_intent_handlers(self):
-        return {
-            "set_autopilot_heading": self._set_heading,
-            "set_autopilot_altitude": self._set_altitude,
-            "set_flight_level": self._set_flight_level,
-            "toggle_landing_gear": self._toggle_landing_gear,
-            "toggle_flaps": self._toggle_flaps,
-            "toggle_autopilot_1": self._toggle_autopilot_1,
-            "toggle_autopilot_2": self._toggle_autopilot_2,
-            "toggle_flight_director_1": self._toggle_flight_director_1,
-            "toggle_flight_director_2": self._toggle_flight_director_2,
-            "toggle_parking_brake": self._toggle_parking_brake,
-            "toggle_engine_1": self._toggle_engine_1,
-            "toggle_engine_2": self._toggle_engine_2,
-            "set_com_frequency": self._set_com_frequency,
-        }
+    def _setup_speculation(self):
+        # Streaming ASR lets NLU run on partial transcripts while the key is still held
+        if not self.asr.supports_streaming or self.capture is None:
+            return None
+        speculator = SpeculativeInterpreter(self.asr, self._predict_partial, normalize_aviation_input, log=self.log)
+        self.capture.listener = speculator.feed
+        self.log("[Vimaan] Speculative streaming NLU enabled")
+        return speculator
     
     def XPluginStart(self):
+        self.model_service.start()
+        if self.modelWatcher:
+            self.modelWatcher.start()
+        self._build_dispatch_table()
         self.hotkeyPress = xp.registerHotKey(
             xp.VK_Z, xp.DownFlag,
             "Vimaan Push-to-Talk -> Press",
@@ -121,14 +169,58 @@ class PythonInterface:
             "Vimaan Push-to-Talk -> Release",
             self.OnReleaseCallback
         )
-        xp.speakString("Vimaan AI CoPilot Ready")
+        self.reloadCommand = xp.createCommand("vimaan/reload_model", "Vimaan: reload the promoted NLU model")
+        xp.registerCommandHandler(self.reloadCommand, self.ReloadModelCommandHandler, 1, None)
+        self.worker.start()
+        if self.speculator:
+            self.speculator.start()
+        xp.registerFlightLoopCallback(self.FlightLoopCallback, self.FLIGHT_LOOP_INTERVAL, 0)
+        self.flightLoopRegistered = True
+        if self.capture:
+            self.capture.start()
+        self.log(f"[Vimaan] Plugin started in {(time.perf_counter() - self.startedAt) * 1000:.0f} ms, model loading in background")
         return self.Name, self.Sig, self.Desc
     
+    def _build_dispatch_table(self):
+        dataref_paths, command_paths = action_paths(ACTIONS)
+        resolved = self.handles.resolve(dataref_paths, command_paths)
+        self.log(f"[Vimaan] Resolved {resolved['datarefs']} datarefs and {resolved['commands']} commands")
+        for kind, path in resolved['missing']:
+            self.log(f"[Vimaan] WARNING: could not resolve {kind} {path}", level="WARNING")
+        
+        self.actions, skipped = compile_actions(ACTIONS, self.handles, xp)
+        self.log(f"[Vimaan] Dispatch table ready: {len(self.actions)} intents")
+        for intent, paths in skipped.items():
+            self.log(f"[Vimaan] WARNING: intent '{intent}' disabled, unresolved: {paths}", level="WARNING")
+    
     def XPluginStop(self):
+        if self.capture:
+            self.capture.stop()
+        if self.flightLoopRegistered:
+            xp.unregisterFlightLoopCallback(self.FlightLoopCallback, 0)
+            self.flightLoopRegistered = False
+        if self.modelWatcher:
+            self.modelWatcher.stop()
+        self.worker.stop()
+        if self.speculator:
+            self.speculator.stop()
+            self.log(f"[Vimaan] Speculation stats: {self.speculator.stats}")
+        self.log(f"[Vimaan] ASR stats: {self.asr.stats()}")
+        self.log(f"[Vimaan] Prediction cache stats: {self.model_service.cache.stats()}")
+        if self.model_service.fast_path:
+            self.log(f"[Vimaan] Template fast path stats: {self.model_service.fast_path.stats()}")
+        self.log("[Vimaan] Latency summary:")
+        for line in self.latency.format_summary():
+            self.log(f"[Vimaan]   {line}")
+        if self.events:
+            self.log(f"[Vimaan] Event log stats: {self.events.metrics()}")
+            self.events.stop()
         if self.hotkeyPress:
             xp.unregisterHotKey(self.hotkeyPress)
         if self.hotkeyRelease:
             xp.unregisterHotKey(self.hotkeyRelease)
+        if self.reloadCommand:
+            xp.unregisterCommandHandler(self.reloadCommand, self.ReloadModelCommandHandler, 1, None)
     
     def XPluginEnable(self):
         return 1
@@ -141,201 +233,197 @@ class PythonInterface:
     
     def OnPressCallback(self, inRefcon):
         if not self.isRecording:
-            if self.microphone is None:
+            if self.capture is None:
                 self.log("[Vimaan] Microphone not available")
                 xp.speakString("Microphone not available")
                 return
             
-            self.log("[Vimaan] Recording started...")
-            xp.speakString("Listening")
-            self.isRecording = True
+            if not self.model_service.is_ready():
+                self.log(f"[Vimaan] Command ignored, model is {self.model_service.state}")
+                self._speak_model_not_ready("[Vimaan]")
+                return
             
-            try:
-                self.source = self.microphone.__enter__()
-                self.recognizer.adjust_for_ambient_noise(self.source, duration=0.5)
-                self.audioData = self.recognizer.listen(self.source, timeout=None, phrase_time_limit=None)
-            except Exception as e:
-                self.log(f"[Vimaan] Error during recording: {str(e)}")
+            # The utterance is opened first so the very first captured chunks are attributed to it
+            self.utterance = self.speculator.begin() if self.speculator else None
+            if not self.capture.begin():
+                if self.speculator:
+                    self.speculator.end(self.utterance)
+                self.log("[Vimaan] Audio capture not ready")
                 xp.speakString("Microphone error")
+                return
+            
+            self.log(f"[Vimaan] Recording started (energy threshold {self.noiseFloor.threshold:.0f})...")
+            xp.speakString("Listening")
+            self.isRecording = True
     
     def OnReleaseCallback(self, inRefcon):
         if self.isRecording:
-            self.log("[Vimaan] Recording stopped. Processing...")
-            xp.speakString("Processing")
             self.isRecording = False
-            self.microphone.__exit__(None, None, None)
-            
-            try:
-                text = self.recognizer.recognize_google(self.audioData)
-                self.log(f"[Vimaan] Recognized text: {text}")
-                self.ExecuteCommand(text)
-            except sr.UnknownValueError:
-                self.log("[Vimaan] Speech not recognized")
-                xp.speakString("I could not understand you")
-            except sr.RequestError as e:
-                self.log(f"[Vimaan] Google Speech API error: {str(e)}")
-                xp.speakString("Recognition service failed")
-            except Exception as e:
-                self.log(f"[Vimaan] Unexpected error: {str(e)}")
-                xp.speakString("An error occurred")
-    
-    def ExecuteCommand(self, text: str):
-        try:
-            result = predict(
-                text,
-                self.loader.model,
-                self.loader.tokenizer,
-                self.device,
-                self.loader.intent_map_rev,
-                self.loader.slot_map_rev
-            )
-            
-            intent_pred = result['intent']
-            slots = result['slots']
+            trace = CommandTrace()
+            with trace.stage('capture'):
+                audio = self.capture.end()
+                if self.speculator:
+                    self.speculator.end(self.utterance)
+            if audio is None:
+                self.log(f"[Vimaan][{trace.trace_id}] No audio captured")
+                xp.speakString("I could not hear you")
+                return
             
-            self.log(f"[Vimaan] Predicted Intent: {intent_pred}")
-            self.log(f"[Vimaan] Extracted Slots: {slots}")
+            job = {
+                'audio': audio,
+                'utterance': self.utterance,
+                'trace': trace,
+                'submitted_at': time.perf_counter()
+            }
+            if not self.worker.submit(job):
+                self.log(f"[Vimaan][{trace.trace_id}] Command queue full, dropping utterance")
+                xp.speakString("Still busy")
+                return
             
-            if intent_pred in self.intent_to_command and intent_pred != "None":
-                handler = self.intent_to_command[intent_pred]
-                handler(slots)
-                self.log(f"[Vimaan] Command executed: {intent_pred}")
-                xp.speakString("Command executed")
+            self.log(f"[Vimaan][{trace.trace_id}] Recording stopped. Processing...")
+            xp.speakString("Processing")
+    
+    def ReloadModelCommandHandler(self, commandRef, phase, refCon):
+        if phase == xp.CommandBegin:
+            if self.model_service.reload():
+                self.log("[Vimaan] Reloading the promoted model in the background")
+                xp.speakString("Reloading Vimaan model")
             else:
-                self.log(f"[Vimaan] Intent '{intent_pred}' not recognized")
-                xp.speakString("Command not found")
-                
-        except Exception as e:
-            self.log(f"[Vimaan] Error executing command: {str(e)}")
-            import traceback
-            self.log(f"[Vimaan] Traceback: {traceback.format_exc()}")
-            xp.speakString("Command execution failed")
+                xp.speakString("Vimaan model is already loading")
+        return 1
     
-    def _set_heading(self, slots):
-        degrees = slots.get('degrees')
-        if degrees:
-            try:
-                heading_value = float(degrees)
-                xp.setDataf(xp.findDataRef("sim/cockpit/autopilot/heading_mag"), heading_value)
-                xp.speakString(f"Setting heading to {degrees} degrees")
-            except:
-                xp.speakString("Invalid heading value")
+    def _on_model_promoted(self, model_path):
+        # Runs on the watcher thread; a version already being served needs no reload
+        version = self.model_service.model_version
+        if version and version[0] == model_path:
+            return True
+        return self.model_service.reload(model_path)
     
-    def _set_altitude(self, slots):
-        altitude = slots.get('altitude')
-        if altitude:
-            try:
-                altitude_value = float(altitude)
-                xp.setDataf(xp.findDataRef("sim/cockpit/autopilot/altitude"), altitude_value)
-                xp.speakString(f"Setting altitude to {altitude} feet")
-            except:
-                xp.speakString("Invalid altitude value")
+    def FlightLoopCallback(self, sinceLast, elapsedTime, counter, refCon):
+        if self.modelStateAnnounced != self.model_service.state:
+            self._announce_model_state()
+        last_reload = self.model_service.last_reload
+        if last_reload and self.modelReloadAnnounced != last_reload['id']:
+            self._announce_model_reload(last_reload)
+        for result in self.worker.drain():
+            self._handle_result(result)
+        return self.FLIGHT_LOOP_INTERVAL
     
-    def _set_flight_level(self, slots):
-        flight_level = slots.get('flight_level')
-        if flight_level:
-            try:
-                fl_value = float(flight_level) * 100
-                xp.setDataf(xp.findDataRef("sim/cockpit/autopilot/altitude"), fl_value)
-                xp.speakString(f"Setting flight level {flight_level}")
-            except:
-                xp.speakString("Invalid flight level")
+    def _announce_model_state(self):
+        state = self.model_service.state
+        self.modelStateAnnounced = state
+        if state == ModelService.READY:
+            xp.speakString("Vimaan AI CoPilot Ready")
+        elif state == ModelService.FAILED:
+            self.log(f"[Vimaan] ERROR loading model: {self.model_service.error}", level="ERROR")
+            self.log("[Vimaan] Run the vimaan/reload_model command to retry the load", level="ERROR")
+            xp.speakString("Vimaan model failed to load")
     
-    def _toggle_landing_gear(self, slots):
-        state = slots.get('state', 'toggle')
-        if state == 'up':
-            xp.commandOnce(xp.findCommand("sim/flight_controls/landing_gear_up"))
-            xp.speakString("Gear up")
-        elif state == 'down':
-            xp.commandOnce(xp.findCommand("sim/flight_controls/landing_gear_down"))
-            xp.speakString("Gear down")
+    def _speak_model_not_ready(self, tag):
+        # A failed load never becomes ready on its own; only a reload retries it
+        if self.model_service.state == ModelService.FAILED:
+            self.log(f"{tag} Model failed to load ({self.model_service.error}), "
+                     f"run the vimaan/reload_model command to retry the load", level="WARNING")
+            xp.speakString("Vimaan model failed to load")
         else:
-            xp.commandOnce(xp.findCommand("sim/flight_controls/landing_gear_toggle"))
-    
-    def _toggle_flaps(self, slots):
-        state = slots.get('state', 'toggle')
-        if state == 'up':
-            xp.commandOnce(xp.findCommand("sim/flight_controls/flaps_up"))
-            xp.speakString("Flaps up")
-        elif state == 'down':
-            xp.commandOnce(xp.findCommand("sim/flight_controls/flaps_down"))
-            xp.speakString("Flaps down")
-    
-    def _toggle_autopilot_1(self, slots):
-        state = slots.get('state', 'toggle')
-        if state == 'on':
-            xp.commandOnce(xp.findCommand("sim/autopilot/servos_on"))
-            xp.speakString("Autopilot 1 on")
-        elif state == 'off':
-            xp.commandOnce(xp.findCommand("sim/autopilot/servos_toggle"))
-            xp.speakString("Autopilot 1 off")
+            xp.speakString("Vimaan is still warming up")
     
-    def _toggle_autopilot_2(self, slots):
-        state = slots.get('state', 'toggle')
-        if state == 'on':
-            xp.commandOnce(xp.findCommand("sim/autopilot/servos2_on"))
-            xp.speakString("Autopilot 2 on")
-        elif state == 'off':
-            xp.commandOnce(xp.findCommand("sim/autopilot/servos2_toggle"))
-            xp.speakString("Autopilot 2 off")
-    
-    def _toggle_flight_director_1(self, slots):
-        state = slots.get('state', 'toggle')
-        if state == 'on':
-            xp.commandOnce(xp.findCommand("sim/autopilot/fdir_on"))
-            xp.speakString("Flight Director 1 on")
-        elif state == 'off':
-            xp.commandOnce(xp.findCommand("sim/autopilot/fdir_toggle"))
-            xp.speakString("Flight Director 1 off")
+    def _announce_model_reload(self, last_reload):
+        self.modelReloadAnnounced = last_reload['id']
+        if last_reload['status'] == 'swapped':
+            xp.speakString(f"Vimaan model updated to {os.path.basename(last_reload['model_path'])}")
+        else:
+            self.log(f"[Vimaan] ERROR reloading model: {last_reload['error']}", level="ERROR")
+            xp.speakString("Vimaan model update failed, keeping the current model")
     
-    def _toggle_flight_director_2(self, slots):
-        state = slots.get('state', 'toggle')
-        if state == 'on':
-            xp.commandOnce(xp.findCommand("sim/autopilot/fdir2_on"))
-            xp.speakString("Flight Director 2 on")
-        elif state == 'off':
-            xp.commandOnce(xp.findCommand("sim/autopilot/fdir2_toggle"))
-            xp.speakString("Flight Director 2 off")
+    def _recognize(self, job):
+        trace = job['trace']
+        trace.record('queue', (time.perf_counter() - job['submitted_at']) * 1000)
+        
+        with trace.stage('asr'):
+            if self.speculator:
+                job['streamed'] = self.speculator.collect(job['utterance'])
+                if job['streamed'] and job['streamed']['transcript'] is None:
+                    raise sr.UnknownValueError()
+            
+            if job.get('streamed'):
+                transcript = job['streamed']['transcript']
+            else:
+                transcript = self.asr.transcribe(job['audio'])
+        self.log(f"[Vimaan][{trace.trace_id}] Recognized text: {transcript['text']} ({transcript['backend']}, {transcript['latency_ms']:.0f} ms)")
+        return transcript['text']
     
-    def _toggle_parking_brake(self, slots):
-        state = slots.get('state', 'toggle')
-        if state == 'on':
-            xp.commandOnce(xp.findCommand("sim/flight_controls/park_brake_set"))
-            xp.speakString("Parking brake on")
-        elif state == 'off':
-            xp.commandOnce(xp.findCommand("sim/flight_controls/park_brake_release"))
-            xp.speakString("Parking brake off")
+    def _handle_result(self, result):
+        trace = result['job']['trace']
+        tag = f"[Vimaan][{trace.trace_id}]"
+        trace.record('result_wait', (time.perf_counter() - result['finished_at']) * 1000)
+        
+        status = result['status']
+        if status == 'ok':
+            self.ExecuteCommand(result['prediction'], trace)
+        elif status == 'not_understood':
+            self.log(f"{tag} Speech not recognized")
+            xp.speakString("I could not understand you")
+        elif status == 'not_ready':
+            self.log(f"{tag} Command dropped: {result['error']}")
+            self._speak_model_not_ready(tag)
+        elif status == 'asr_error':
+            self.log(f"{tag} Speech recognition error ({self.asr.name}): {result['error']}", level="WARNING", trace_id=trace.trace_id)
+            xp.speakString("Recognition service failed")
+        else:
+            self.log(f"{tag} Unexpected error: {result['error']}", level="ERROR", trace_id=trace.trace_id)
+            xp.speakString("An error occurred")
+        
+        self.latency.add(trace)
+        self.log(f"{tag} Latency: {trace.summary()}", event="latency", trace_id=trace.trace_id, stages=trace.stages)
     
-    def _toggle_engine_1(self, slots):
-        state = slots.get('state', 'toggle')
-        if state == 'on':
-            xp.commandOnce(xp.findCommand("sim/starters/engage_starter_1"))
-            xp.speakString("Engine 1 on")
-        elif state == 'off':
-            xp.commandOnce(xp.findCommand("sim/starters/shut_down_1"))
-            xp.speakString("Engine 1 off")
+    def _predict(self, text, trace=None):
+        return self.model_service.predict(text, trace)
     
-    def _toggle_engine_2(self, slots):
-        state = slots.get('state', 'toggle')
-        if state == 'on':
-            xp.commandOnce(xp.findCommand("sim/starters/engage_starter_2"))
-            xp.speakString("Engine 2 on")
-        elif state == 'off':
-            xp.commandOnce(xp.findCommand("sim/starters/shut_down_2"))
-            xp.speakString("Engine 2 off")
+    def _predict_partial(self, text):
+        # Partial transcripts stay out of the prediction cache and its hit rate
+        return self.model_service.predict(text, cache=False)
     
-    def _set_com_frequency(self, slots):
-        com_port = slots.get('com_port', '1')
-        frequency = slots.get('frequency')
+    def InterpretCommand(self, text: str, job=None):
+        trace = job['trace'] if job else None
+        tag = f"[Vimaan][{trace.trace_id}]" if trace else "[Vimaan]"
         
-        if frequency:
-            try:
-                freq_value = float(frequency)
-                if com_port == '1':
-                    xp.setDataf(xp.findDataRef("sim/cockpit/radios/com1_freq_hz"), freq_value * 1000000)
-                    xp.speakString(f"COM 1 set to {frequency}")
-                elif com_port == '2':
-                    xp.setDataf(xp.findDataRef("sim/cockpit/radios/com2_freq_hz"), freq_value * 1000000)
-                    xp.speakString(f"COM 2 set to {frequency}")
-            except:
-                xp.speakString("Invalid frequency")
\ No newline at end of file
+        result = None
+        if self.speculator and job:
+            result = self.speculator.commit(job.get('streamed'), text)
+            if result is not None:
+                self.model_service.remember(result)
+                self.log(f"{tag} Committed speculative prediction from partial transcript")
+        if result is None:
+            result = self._predict(text, trace)
+        self.log(f"{tag} Predicted Intent: {result['intent']}")
+        self.log(f"{tag} Extracted Slots: {result['slots']}")
+        return result
+    
+    def ExecuteCommand(self, result, trace=None):
+        tag = f"[Vimaan][{trace.trace_id}]" if trace else "[Vimaan]"
+        try:
+            intent_pred = result['intent']
+            slots = result['slots']
+            
+            action = self.actions.get(intent_pred)
+            if action is None:
+                self.log(f"{tag} Intent '{intent_pred}' not recognized")
+                xp.speakString("Command not found")
+                return
+            
+            with trace_stage(trace, 'dispatch'):
+                outcome = action.execute(slots)
+            if outcome['speech']:
+                xp.speakString(outcome['speech'])
+            if outcome['executed']:
+                self.log(f"{tag} Command executed: {intent_pred} ({outcome['detail']})")
+                xp.speakString("Command executed")
+            else:
+                self.log(f"{tag} Command not executed: {intent_pred} ({outcome['detail']})")
+                
+        except Exception as e:
+            self.log(f"{tag} Error executing command: {str(e)}", level="ERROR")
+            import traceback
+            self.log(f"{tag} Traceback: {traceback.format_exc()}", level="ERROR")
+            xp.speakString("Command execution failed")